@@ -5,6 +5,11 @@ A cross-platform Python launcher for managing conda environments and running the
 """
 
 import argparse
+import collections
+import json
+import locale
+import os
+import shutil
 import subprocess
 import sys
 from pathlib import Path
@@ -25,22 +30,103 @@ def log(message):
 
 
 def run_command(cmd, capture_output=False, check=True):
-    """Run a command and return the result."""
+    """Run a command (given as an argument list, without a shell) and return the result."""
+    # Resolve the executable (e.g. conda.bat on Windows), as no shell is used
+    executable = shutil.which(cmd[0])
+    if executable is None:
+        return False, "", f"Command not found: {cmd[0]}"
+    cmd = [executable] + list(cmd[1:])
     try:
         if capture_output:
-            result = subprocess.run(cmd, shell=True, capture_output=True, text=True, check=check)
+            result = subprocess.run(cmd, capture_output=True, text=True, check=check)
             return result.returncode == 0, result.stdout.strip(), result.stderr.strip()
         else:
-            result = subprocess.run(cmd, shell=True, check=check)
+            result = subprocess.run(cmd, check=check)
             return result.returncode == 0, "", ""
-    except subprocess.CalledProcessError as e:
+    except (subprocess.CalledProcessError, OSError) as e:
         return False, "", str(e)
 
 
+def run_command_stream(cmd, keep_tail=200):
+    """
+    Run a command (given as an argument list, without a shell), passing its output
+    through to the terminal while it runs. Only the last 'keep_tail' lines are kept
+    in memory, and returned as the error details if the command fails.
+    The output is passed through as bytes, so it is never decoded (it may not be in
+    the locale encoding, e.g. Windows OEM code page messages).
+    """
+    executable = shutil.which(cmd[0])
+    if executable is None:
+        return False, "", f"Command not found: {cmd[0]}"
+    cmd = [executable] + list(cmd[1:])
+    tail = collections.deque(maxlen=keep_tail)
+    # Write the launcher's own (buffered) messages before the command output
+    sys.stdout.flush()
+    stdout_buffer = getattr(sys.stdout, "buffer", sys.stdout)
+    try:
+        with subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT) as process:
+            for line in process.stdout:
+                if stdout_buffer is sys.stdout:
+                    sys.stdout.write(line.decode(errors="replace"))
+                else:
+                    stdout_buffer.write(line)
+                stdout_buffer.flush()
+                tail.append(line)
+            process.wait()
+    except OSError as e:
+        return False, "", str(e)
+    if process.returncode != 0:
+        return False, "", b"".join(tail).decode(locale.getpreferredencoding(False), errors="replace").strip()
+    return True, "", ""
+
+
+# Cached output of 'conda info --json' (None until the first query)
+_conda_info = None
+
+
+def get_conda_info():
+    """Return the parsed output of 'conda info --json', querying conda only once."""
+    global _conda_info
+    if _conda_info is None:
+        success, output, _ = run_command(["conda", "info", "--json"], capture_output=True, check=False)
+        if not success:
+            return None
+        try:
+            _conda_info = json.loads(output)
+        except ValueError:
+            return None
+    return _conda_info
+
+
+# Cached result of test_environment (None until the first test)
+_environment_works = None
+
+
+def invalidate_conda_info():
+    """Forget the cached conda information (e.g. after creating or removing an environment)."""
+    global _conda_info, _environment_works
+    _conda_info = None
+    _environment_works = None
+
+
+def get_environments():
+    """Return a {name: path} dict of the named conda environments (from the JSON conda info)."""
+    info = get_conda_info()
+    if info is None:
+        return {}
+    root_prefix = info.get("root_prefix")
+    return {Path(env_path).name: Path(env_path) for env_path in info.get("envs", []) if env_path != root_prefix}
+
+
+def get_environment_path():
+    """Return the path of the conda environment, or None if it does not exist."""
+    return get_environments().get(ENV_NAME)
+
+
 def check_conda():
     """Check if conda is available."""
     log("Checking if conda is available...")
-    success, _, _ = run_command("conda --version", capture_output=True, check=False)
+    success = get_conda_info() is not None
     if success:
         log("Conda found.")
         return True
@@ -55,7 +141,7 @@ def check_git():
         return True
     
     log("Checking if git is available...")
-    success, _, _ = run_command("git --version", capture_output=True, check=False)
+    success, _, _ = run_command(["git", "--version"], capture_output=True, check=False)
     if success:
         log("Git found.")
         return True
@@ -66,31 +152,45 @@ def check_git():
 
 def environment_exists():
     """Check if the conda environment exists."""
-    success, output, _ = run_command("conda env list", capture_output=True, check=False)
-    if not success:
-        return False
-    
-    # Check if our environment is in the list
-    for line in output.split('\n'):
-        if line.strip().startswith(ENV_NAME + ' ') or line.strip().startswith(ENV_NAME + '\t'):
-            return True
-    return False
+    return get_environment_path() is not None
 
 
 def test_environment():
-    """Test if the environment actually works."""
-    success, _, _ = run_command(f"conda run --no-capture-output -n {ENV_NAME} python --version", capture_output=True, check=False)
+    """Test if the environment actually works (the result is cached)."""
+    global _environment_works
+    if _environment_works is None:
+        _environment_works = _run_environment_test()
+    return _environment_works
+
+
+def _run_environment_test():
+    """Run the environment's interpreter to check that it works."""
+    env_path = get_environment_path()
+    if env_path is None:
+        return False
+    # Run the environment's interpreter directly instead of going through 'conda run'
+    if os.name == "nt":
+        python_path = env_path / "python.exe"
+    else:
+        python_path = env_path / "bin" / "python"
+    if not python_path.is_file():
+        return False
+    success, _, _ = run_command([str(python_path), "--version"], capture_output=True, check=False)
     return success
 
 
 def create_environment():
     """Create the conda environment."""
+    global _environment_works
     log(f"Creating environment '{ENV_NAME}' with Python {PYTHON_VERSION}...")
-    success, _, error = run_command(f"conda create -n {ENV_NAME} python={PYTHON_VERSION} -y", check=False)
+    success, _, error = run_command_stream(["conda", "create", "-n", ENV_NAME, f"python={PYTHON_VERSION}", "-y"])
+    invalidate_conda_info()
     if not success:
         log(f"Error: Failed to create Conda environment '{ENV_NAME}'.")
         log(f"Error details: {error}")
         return False
+    # A freshly created environment is known to work, no need to test it again
+    _environment_works = True
     log(f"Environment '{ENV_NAME}' created successfully.")
     return True
 
@@ -98,7 +198,8 @@ def create_environment():
 def remove_environment():
     """Remove the conda environment."""
     log(f"Removing environment '{ENV_NAME}'...")
-    success, _, _ = run_command(f"conda env remove -n {ENV_NAME} -y", check=False)
+    success, _, _ = run_command(["conda", "env", "remove", "-n", ENV_NAME, "-y"], check=False)
+    invalidate_conda_info()
     return success
 
 
@@ -109,7 +210,7 @@ def install_requirements():
         return True
     
     log(f"Installing requirements from {REQUIREMENTS_FILE} into {ENV_NAME}...")
-    success, _, error = run_command(f"conda run --no-capture-output -n {ENV_NAME} python -m pip install -r {REQUIREMENTS_FILE}", check=False)
+    success, _, error = run_command_stream(["conda", "run", "--no-capture-output", "-n", ENV_NAME, "python", "-m", "pip", "install", "-r", REQUIREMENTS_FILE])
     if not success:
         log(f"Error: Failed to install requirements in '{ENV_NAME}'.")
         log(f"Error details: {error}")
@@ -179,19 +280,15 @@ def run_main(args):
             return False
         log("Autoconfiguration completed. Proceeding with main script execution...")
     
-    # Build command
-    cmd_parts = ["conda", "run", "--no-capture-output", "-n", ENV_NAME, "python", MAIN_SCRIPT]
-    if args:
-        cmd_parts.extend(args)
-    
-    cmd = " ".join(f'"{part}"' if " " in part else part for part in cmd_parts)
-    
+    # Build command (argument list passed as is, no quoting needed)
+    cmd_parts = ["conda", "run", "--no-capture-output", "-n", ENV_NAME, "python", MAIN_SCRIPT, *args]
+
     if args:
         log(f"Executing {MAIN_SCRIPT} {' '.join(args)} in {ENV_NAME}...")
     else:
         log(f"Executing {MAIN_SCRIPT} in {ENV_NAME}...")
     
-    success, _, error = run_command(cmd, check=False)
+    success, _, error = run_command(cmd_parts, check=False)
     if not success:
         log(f"Error: Failed to execute {MAIN_SCRIPT} in '{ENV_NAME}'.")
         log(f"Error details: {error}")
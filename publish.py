@@ -1,14 +1,14 @@
 # Standard libraries
-import os
+from pathlib import Path
 # Third-party libraries
 from src.cfis_utils.publish_utils import PublishUtils
 
 if __name__ == "__main__":
-    cwd = os.getcwd()
+    cwd = Path.cwd()
     PublishUtils.publish_new_python_package_version(
-        toml_file_path=os.path.join(cwd, "pyproject.toml"),
-        readme_file_path=os.path.join(cwd, "README.md"),
+        toml_file_path=cwd / "pyproject.toml",
+        readme_file_path=cwd / "README.md",
         repository_path=cwd,
-        requirements_path=os.path.join(cwd, "requirements.txt")
+        requirements_path=cwd / "requirements.txt"
     )
     
@@ -1,19 +1,50 @@
 # Standard libraries
+import functools
 import gzip
+import os
 import shutil
+import struct
+import tempfile
+import time
+import zlib
 from pathlib import Path
-from typing import Union, Optional
+from typing import Union, Optional, BinaryIO
+# Third-party libraries (optional, SIMD accelerated and multithreaded gzip if installed)
+try:
+    from isal import igzip
+except ImportError:
+    igzip = None
+try:
+    import mgzip
+except ImportError:
+    mgzip = None
+
+# Size of the chunks copied between the input and output files
+_COPY_BUFFER_SIZE = 1 << 20 # 1 MiB
+# Files up to this size are compressed with a single zlib call instead of streaming
+_ONE_SHOT_MAX_SIZE = 16 << 20 # 16 MiB
+# Highest compression level supported by ISA-L
+_ISAL_MAX_LEVEL = 3
+# Size of the blocks compressed in parallel by mgzip, smaller files are not split
+_MGZIP_BLOCK_SIZE = 16 << 20 # 16 MiB
+# Process umask, to give the output written through a (0600) temporary file the
+# permissions open() would (os.umask can only be read by setting it)
+_UMASK = os.umask(0o022)
+os.umask(_UMASK)
 
 class CompressionUtils:
     """
     A utility class with compression methods.
+    Uses the multithreaded mgzip package or the ISA-L gzip implementation (isal
+    package) when they are installed, otherwise the standard gzip module.
     """
 
     @staticmethod
     def compress_file_gz(input_filepath: Union[str, Path],
                         output_filepath: Optional[Union[str, Path]] = None,
                         compresslevel: int = 9,
-                        remove_original: bool = False) -> None:
+                        remove_original: bool = False,
+                        threads: Optional[int] = os.cpu_count()) -> None:
         """
         Compresses a single file using gzip. Allows specifying compression level.
 
@@ -23,8 +54,16 @@ class CompressionUtils:
                          If None, the compressed file will be saved in the same directory as input_filepath.
             compresslevel: Compression level (0-9). 9 is default (slowest, best compression).
                            0 is no compression. 1 is fastest (worst compression).
+                           When ISA-L is used, levels above 3 use its highest level (3).
             remove_original: If True, the original file will be removed after compression.
                              Default is False (original file will be kept).
+                             The compressed file is written to a temporary file, flushed to disk
+                             and renamed before the original is removed, so an interruption
+                             never loses the data and callers don't need a backup copy.
+            threads: Number of threads compressing blocks of the file in parallel, used if
+                     mgzip is installed, it is greater than 1 and the file is larger than
+                     one block (16 MiB). Defaults to the CPU count. The result is a
+                     standard gzip file.
 
         Raises:
             ValueError: If compresslevel is not between 0 and 9.
@@ -44,12 +83,41 @@ class CompressionUtils:
         # Append '.gz' to output_filepath
         output_filepath = Path(str(output_filepath) + '.gz')
 
-        # Open the input file in binary read mode and the output gzip file in binary write mode
-        with open(input_filepath, 'rb') as f_in:
-            with gzip.open(output_filepath, 'wb', compresslevel=compresslevel) as f_out:
-                # Copy data in chunks from input to compressed output
-                shutil.copyfileobj(f_in, f_out)
-        
+        # Files that fit in a single block gain nothing from mgzip's threads.
+        # Level 0 (no compression) is left to gzip, ISA-L's lowest level still compresses
+        input_size = os.stat(input_filepath).st_size
+        if mgzip is not None and threads is not None and threads > 1 and input_size > _MGZIP_BLOCK_SIZE:
+            gzip_file = functools.partial(mgzip.MultiGzipFile, thread=threads, blocksize=_MGZIP_BLOCK_SIZE)
+        elif igzip is not None and compresslevel > 0:
+            gzip_file, compresslevel = igzip.IGzipFile, min(compresslevel, _ISAL_MAX_LEVEL)
+        else:
+            gzip_file = gzip.GzipFile
+
+        # Write to a temporary file that replaces the output only once it is complete and
+        # on disk, so a crash never leaves a truncated output (or removes the original
+        # without a valid compressed copy)
+        # without a valid compressed copy). It is uniquely named, an existing file is never overwritten
+        fd, temp_filepath = tempfile.mkstemp(dir=output_filepath.parent, prefix='.' + output_filepath.name + '.', suffix='.tmp')
+        temp_filepath = Path(temp_filepath)
+        try:
+            # The plain file is unbuffered, each chunk is read with a single system call
+            with open(input_filepath, 'rb', buffering=0) as f_in, open(fd, 'wb') as f_temp:
+                if gzip_file is gzip.GzipFile and input_size <= _ONE_SHOT_MAX_SIZE:
+                    # Small file: compress it in one call, without the per-chunk overhead of GzipFile
+                    CompressionUtils._write_gz(f_in.read(), f_temp, output_filepath, compresslevel)
+                else:
+                    # The final name is given for the gzip header (it stores the original file name)
+                    with gzip_file(filename=str(output_filepath), mode='wb', compresslevel=compresslevel, fileobj=f_temp) as f_out:
+                        # Copy data in chunks from input to compressed output
+                        shutil.copyfileobj(f_in, f_out, _COPY_BUFFER_SIZE)
+                f_temp.flush()
+                os.fsync(f_temp.fileno())
+            os.chmod(temp_filepath, 0o666 & ~_UMASK)
+            os.replace(temp_filepath, output_filepath)
+        except BaseException:
+            temp_filepath.unlink(missing_ok=True)
+            raise
+
         # Remove the original file if specified
         if remove_original:
             if input_filepath.is_file():
@@ -57,10 +125,38 @@ class CompressionUtils:
             else:
                 raise FileNotFoundError(f"Original file not found at: {input_filepath}")
 
+    @staticmethod
+    def _write_gz(data: bytes, f_out: BinaryIO, output_filepath: Path, compresslevel: int) -> None:
+        """
+        Writes data compressed in a single zlib call as a gzip file, with the same
+        header as gzip.GzipFile (original file name, modification time, flags).
+        """
+        # Original file name: the output name without '.gz', if it can be encoded
+        filename = output_filepath.name
+        if filename.endswith('.gz'):
+            filename = filename[:-3]
+        try:
+            filename_bytes = filename.encode('latin-1')
+        except UnicodeEncodeError:
+            filename_bytes = b''
+        # Header: magic, deflate method, FNAME flag, mtime, extra flags (best/fastest), OS unknown
+        extra_flags = b'\002' if compresslevel == 9 else b'\004' if compresslevel == 1 else b'\000'
+        header = b'\037\213\010' + (b'\010' if filename_bytes else b'\000') + struct.pack('<L', int(time.time())) + extra_flags + b'\377'
+        if filename_bytes:
+            header += filename_bytes + b'\000'
+        # Raw deflate stream (negative window bits), like GzipFile
+        compressor = zlib.compressobj(compresslevel, zlib.DEFLATED, -zlib.MAX_WBITS, zlib.DEF_MEM_LEVEL, 0)
+        f_out.write(header)
+        f_out.write(compressor.compress(data))
+        f_out.write(compressor.flush())
+        # Trailer: CRC32 and size of the uncompressed data
+        f_out.write(struct.pack('<LL', zlib.crc32(data), len(data) & 0xffffffff))
+
     @staticmethod
     def decompress_file_gz(input_filepath: Union[str, Path],
                            output_filepath: Optional[Union[str, Path]] = None,
-                           remove_original: bool = False) -> None:
+                           remove_original: bool = False,
+                           threads: Optional[int] = os.cpu_count()) -> None:
         """
         Decompresses a single file compressed with gzip.
 
@@ -69,6 +165,9 @@ class CompressionUtils:
             output_filepath: Path where the decompressed file will be saved.
                             If None, the decompressed file will be saved in the same directory as input_filepath.
             remove_original: If True, the original compressed file will be removed after decompression.
+            threads: Number of threads decompressing in parallel, used if mgzip is installed,
+                     it is greater than 1 and the file was compressed by mgzip (other gzip
+                     files can't be split into independent blocks). Defaults to the CPU count.
         """
         # Is output_filepath None?
         if output_filepath is None:
@@ -85,14 +184,29 @@ class CompressionUtils:
                 raise FileNotFoundError(f"Compressed file not found at: {input_filepath}")
 
         # Open the compressed input file in binary read mode and the output file in binary write mode
-        with gzip.open(input_filepath, 'rb') as f_in:
+        if mgzip is not None and threads is not None and threads > 1 and CompressionUtils._is_mgzip_file(input_filepath):
+            gzip_open = functools.partial(mgzip.open, thread=threads)
+        else:
+            gzip_open = igzip.open if igzip is not None else gzip.open
+        with gzip_open(input_filepath, 'rb') as f_in:
             with open(output_filepath, 'wb') as f_out:
                 # Copy data in chunks from compressed input to decompressed output
-                shutil.copyfileobj(f_in, f_out)
+                shutil.copyfileobj(f_in, f_out, _COPY_BUFFER_SIZE)
 
         # Remove the original compressed file if specified
         if remove_original:
             if input_filepath.is_file():
                 input_filepath.unlink()
             else:
-                raise FileNotFoundError(f"Compressed file not found at: {input_filepath}")
\ No newline at end of file
+                raise FileNotFoundError(f"Compressed file not found at: {input_filepath}")
+
+    @staticmethod
+    def _is_mgzip_file(filepath: Path) -> bool:
+        """
+        Returns True if the gzip file was written by mgzip, which stores the size of each
+        independently compressed block in an 'IG' extra field of the gzip header.
+        """
+        with open(filepath, 'rb') as f:
+            header = f.read(14)
+        # Magic number, FEXTRA flag set and the first extra subfield ID is 'IG'
+        return len(header) == 14 and header[:2] == b'\x1f\x8b' and bool(header[3] & 0x04) and header[12:14] == b'IG'
@@ -1,9 +1,53 @@
 # Standard imports
+import copy
 import os
-from typing import List, Dict, Any
+import re
+import tempfile
+from typing import List, Dict, Any, Tuple, Union, Optional
 # Third-party imports
 import tomlkit
 from tomlkit.exceptions import ParseError
+from tomlkit.items import Bool, Float, Integer, Item, String, Trivia
+# tomllib (read-only, faster than tomlkit) is part of the standard library from Python 3.11
+try:
+    import tomllib
+except ImportError:
+    import tomli as tomllib
+
+# Configuration files parsed with tomllib: {absolute path: ((mtime in ns, size), data)}
+_config_cache: Dict[str, Tuple[Tuple[int, int], Dict[str, Any]]] = {}
+# Maximum number of files kept in the cache (the oldest entry is evicted first)
+_CONFIG_CACHE_MAX_SIZE = 64
+# Top-level keys of the files updated from a template: {absolute path: ((mtime in ns, size), keys)}
+_template_keys_cache: Dict[str, Tuple[Tuple[int, int], frozenset]] = {}
+
+# Process umask, to give new files written through a (0600) temporary file the
+# permissions open() would (os.umask can only be read by setting it)
+_UMASK = os.umask(0o022)
+os.umask(_UMASK)
+
+# Keys that can be written without quotes
+_BARE_KEY_RE = re.compile(r"[A-Za-z0-9_-]+")
+# Escape sequences of TOML basic strings: quote, backslash and control characters
+# (ESC is written as '\u001b', valid in every TOML version, not as the TOML 1.1 '\e')
+_STRING_ESCAPES = {
+    **{code: f'\\u{code:04x}' for code in [*range(0x20), 0x7f]},
+    ord('"'): '\\"', ord('\\'): '\\\\', ord('\b'): '\\b', ord('\t'): '\\t',
+    ord('\n'): '\\n', ord('\f'): '\\f', ord('\r'): '\\r',
+}
+
+# Item constructors for the common (exact) value types, the same items tomlkit.item()
+# creates after its chain of isinstance checks
+_ITEM_CONSTRUCTORS = {
+    bool: lambda value: Bool(value, Trivia()),
+    int: lambda value: Integer(value, Trivia(), str(value)),
+    float: lambda value: Float(value, Trivia(), str(value)),
+    str: String.from_raw,
+}
+
+def _to_item(value: Any) -> Item:
+    """Converts a Python value to a tomlkit item, dispatching on its exact type."""
+    return _ITEM_CONSTRUCTORS.get(type(value), tomlkit.item)(value)
 
 class ConfigUtils:
     """
@@ -20,6 +64,7 @@ class ConfigUtils:
         If the output_path exists, it loads the existing configuration using tomlkit,
         preserves its formatting/comments, and appends only the parameters from the
         template that are not already present in the file, including their descriptions.
+        The file is replaced atomically, it is never left partially written.
 
         Each item in the template list should be a dictionary with keys:
         'parameter': Name of the parameter (str).
@@ -43,8 +88,17 @@ class ConfigUtils:
 
         if os.path.exists(output_path):
             # --- File exists: Load, check for missing keys, update, and save ---
+            abs_path = os.path.abspath(output_path)
             try:
                 with open(output_path, 'r', encoding='utf-8') as f:
+                    stat = os.fstat(f.fileno())
+                    file_state = (stat.st_mtime_ns, stat.st_size)
+                    # If the file has not changed since it was last processed and already
+                    # has every parameter, there is nothing to do (it is not even parsed)
+                    cached = _template_keys_cache.get(abs_path)
+                    if cached is not None and cached[0] == file_state and \
+                       cached[1].issuperset([item['parameter'] for item in config_template]):
+                        return
                     doc = tomlkit.load(f)
             except ParseError as e:
                 print(f"Error parsing existing TOML file {output_path}: {e}")
@@ -53,11 +107,14 @@ class ConfigUtils:
                 print(f"Error reading existing config file {output_path}: {e}")
                 raise
 
-            existing_params = set(doc.keys())
+            # Top-level keys read from the document body directly (cheaper than doc.keys())
+            existing_params = {key.key for key, _ in doc.body if key is not None}
+            missing_params = {item['parameter'] for item in config_template} - existing_params
+            # Keep the template order, the list is only built if something is missing
             items_to_add = [
                 item for item in config_template
-                if item['parameter'] not in existing_params
-            ]
+                if item['parameter'] in missing_params
+            ] if missing_params else []
 
             if items_to_add:
                 # Add a separator comment before adding new items
@@ -74,42 +131,52 @@ class ConfigUtils:
                     if description:
                         doc.add(tomlkit.comment(description))
 
-                    # Add the key-value pair using tomlkit.item to preserve type
-                    # Use tomlkit.item() which intelligently handles Python types
-                    doc[parameter_name] = tomlkit.item(value)
+                    # Add the key-value pair as a tomlkit item to preserve type
+                    doc[parameter_name] = _to_item(value)
 
                     # Add a newline after the item for spacing
                     doc.add(tomlkit.nl())
 
                 # Save the modified document back to the file (overwrite with new content)
                 try:
-                    with open(output_path, 'w', encoding='utf-8') as f:
-                        f.write(tomlkit.dumps(doc))
+                    ConfigUtils._write_file(output_path, tomlkit.dumps(doc))
+                    stat = os.stat(output_path)
                 except IOError as e:
                     print(f"Error writing updated config file {output_path}: {e}")
                     raise
+                file_state = (stat.st_mtime_ns, stat.st_size)
+                existing_params |= missing_params
+
+            # Remember the state of the file and its keys for the next update
+            if abs_path not in _template_keys_cache and len(_template_keys_cache) >= _CONFIG_CACHE_MAX_SIZE:
+                del _template_keys_cache[next(iter(_template_keys_cache))]
+            _template_keys_cache[abs_path] = (file_state, frozenset(existing_params))
         else:
             # --- File does not exist: Create a new document from the template ---
-            doc = tomlkit.document()
             try:
-                for item in config_template:
-                    parameter_name = item['parameter']
-                    value = item['default_value']
-                    description = item['description']
+                # There is nothing to preserve, so simple templates are written directly as
+                # text, tomlkit is only used for values it must lay out (tables, dates, ...)
+                content = ConfigUtils._format_template(config_template)
+                if content is None:
+                    doc = tomlkit.document()
+                    for item in config_template:
+                        parameter_name = item['parameter']
+                        value = item['default_value']
+                        description = item['description']
 
-                    # Add the comment before the key-value pair
-                    if description:
-                        doc.add(tomlkit.comment(description))
+                        # Add the comment before the key-value pair
+                        if description:
+                            doc.add(tomlkit.comment(description))
 
-                    # Add the key-value pair
-                    doc[parameter_name] = tomlkit.item(value)
+                        # Add the key-value pair
+                        doc[parameter_name] = _to_item(value)
 
-                    # Add a newline for spacing between parameters
-                    doc.add(tomlkit.nl())
+                        # Add a newline for spacing between parameters
+                        doc.add(tomlkit.nl())
+                    content = tomlkit.dumps(doc)
 
                 # Write the new document to the file
-                with open(output_path, 'w', encoding='utf-8') as f:
-                    f.write(tomlkit.dumps(doc))
+                ConfigUtils._write_file(output_path, content)
 
             except IOError as e:
                 print(f"Error writing new config file {output_path}: {e}")
@@ -119,34 +186,147 @@ class ConfigUtils:
                  raise
 
     @staticmethod
-    def load_config_file(config_path: str) -> tomlkit.TOMLDocument:
+    def _write_file(output_path: str, content: str) -> None:
         """
-        Loads configuration parameters from a TOML file using tomlkit.
+        Writes the text to the file atomically: the encoded content is written with
+        os.write to a new temporary file next to it, flushed to disk and renamed over
+        the file, so readers never see a partially written file. Newlines are
+        translated and the permissions of an existing file are kept, like when
+        overwriting it (new files get the default permissions).
+        """
+        if os.linesep != '\n':
+            content = content.replace('\n', os.linesep)
+        data = memoryview(content.encode('utf-8'))
+        try:
+            mode = os.stat(output_path).st_mode & 0o7777
+        except FileNotFoundError:
+            mode = 0o666 & ~_UMASK
+        # Uniquely named (binary mode) file, an existing file is never overwritten
+        directory, name = os.path.split(output_path)
+        fd, temp_path = tempfile.mkstemp(dir=directory or '.', prefix='.' + name + '.', suffix='.tmp')
+        try:
+            try:
+                # Usually a single system call, os.write may write less than requested
+                while data:
+                    data = data[os.write(fd, data):]
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+            os.chmod(temp_path, mode)
+            os.replace(temp_path, output_path)
+        except BaseException:
+            try:
+                os.unlink(temp_path)
+            except OSError:
+                pass
+            raise
+
+    @staticmethod
+    def _format_template(config_template: List[Dict[str, Any]]) -> Optional[str]:
+        """
+        Formats a template as the text of a new TOML file, exactly as tomlkit would write
+        it (description comments, 'key = value' lines and a blank line after each one),
+        using a single string join.
+        Returns None if a value is not a string, boolean, number or list of them, or a
+        parameter is repeated, in which case the document must be built with tomlkit.
+
+        Raises:
+            KeyError: If a dictionary in the template is missing a required key.
+        """
+        parts = []
+        append = parts.append
+        names = set()
+        for item in config_template:
+            parameter_name = item['parameter']
+            value = ConfigUtils._format_value(item['default_value'])
+            description = item['description']
+            if value is None or parameter_name in names:
+                return None
+            names.add(parameter_name)
+            if description:
+                for line in str(description).split('\n'):
+                    append(f"# {line}\n" if line else "#\n")
+            key = parameter_name if _BARE_KEY_RE.fullmatch(parameter_name) else ConfigUtils._format_value(parameter_name)
+            append(f"{key} = {value}\n\n")
+        return "".join(parts)
+
+    @staticmethod
+    def _format_value(value: Any) -> Optional[str]:
+        """
+        Formats a string, boolean, integer, float or list of them as a TOML value, the
+        way tomlkit does. Returns None for any other type.
+        """
+        # Exact types only, subclasses (e.g. enums) are left to tomlkit
+        value_type = type(value)
+        if value_type is str:
+            return '"' + value.translate(_STRING_ESCAPES) + '"'
+        if value_type is bool:
+            return "true" if value else "false"
+        if value_type is int or value_type is float:
+            return str(value)
+        if value_type is list:
+            values = [ConfigUtils._format_value(v) for v in value]
+            if None in values:
+                return None
+            return "[" + ", ".join(values) + "]"
+        return None
+
+    @staticmethod
+    def load_config_file(config_path: str, preserve_formatting: bool = False) -> Union[Dict[str, Any], tomlkit.TOMLDocument]:
+        """
+        Loads configuration parameters from a TOML file.
+
+        By default the file is parsed with tomllib (tomli before Python 3.11) into
+        plain values, which is several times faster than tomlkit. If the document
+        will be modified and written back, use preserve_formatting=True to parse it
+        with tomlkit instead, keeping comments and formatting.
+
+        The data parsed with tomllib is cached until the modification time or size
+        of the file changes, each call returns its own copy (safe to modify).
+        tomlkit documents are not cached, copying one costs about as much as parsing.
 
         Args:
             config_path: The path to the TOML configuration file.
+            preserve_formatting: If True, returns a tomlkit.TOMLDocument (behaves like a
+                                 dictionary) that keeps the formatting of the file.
 
         Returns:
-            A tomlkit.TOMLDocument object containing the data and formatting
-            from the TOML file. Behaves like a dictionary.
+            A dictionary with the data from the TOML file, or a tomlkit.TOMLDocument
+            if preserve_formatting is True.
 
         Raises:
             ValueError: If the config file path does not end with '.toml'.
             FileNotFoundError: If the config file doesn't exist.
-            tomlkit.exceptions.ParseError: If the file content is not valid TOML.
+            tomllib.TOMLDecodeError: If the file content is not valid TOML (default parser).
+            tomlkit.exceptions.ParseError: If the file content is not valid TOML (preserve_formatting=True).
             IOError: If there's an error reading the file.
         """
         if not config_path.lower().endswith('.toml'):
             raise ValueError("The configuration file must have a .toml extension.")
         try:
-            with open(config_path, 'r', encoding='utf-8') as f:
-                # Use tomlkit.load to get a document preserving structure
-                config_data = tomlkit.load(f)
-            return config_data
+            # tomllib requires the file to be opened in binary mode
+            with open(config_path, 'rb') as f:
+                if preserve_formatting:
+                    # Translate newlines like a file opened in text mode
+                    text = f.read().decode('utf-8').replace('\r\n', '\n').replace('\r', '\n')
+                    return tomlkit.parse(text)
+                stat = os.fstat(f.fileno())
+                file_state = (stat.st_mtime_ns, stat.st_size)
+                key = os.path.abspath(config_path)
+                cached = _config_cache.get(key)
+                if cached is not None and cached[0] == file_state:
+                    config_data = cached[1]
+                else:
+                    config_data = tomllib.load(f)
+                    if key not in _config_cache and len(_config_cache) >= _CONFIG_CACHE_MAX_SIZE:
+                        # Dicts keep insertion order, the first key is the oldest entry
+                        del _config_cache[next(iter(_config_cache))]
+                    _config_cache[key] = (file_state, config_data)
+            return copy.deepcopy(config_data)
         except FileNotFoundError:
             print(f"Error: Configuration file not found at {config_path}")
             raise
-        except ParseError:
+        except (tomllib.TOMLDecodeError, ParseError):
             print(f"Error: Could not parse TOML file at {config_path}. Check syntax.")
             raise
         except IOError as e:
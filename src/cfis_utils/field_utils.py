@@ -1,6 +1,180 @@
 # Standard libraries
+import mmap
+import os
+import re
+import shutil
+import tempfile
 from pathlib import Path
-from typing import Union, List
+from typing import Dict, List, Optional, Union
+
+# Buffer size used when rewriting files
+_BUFFER_SIZE = 1 << 16 # 64 KiB
+# Files larger than this are memory-mapped when searching for a field
+_MMAP_MIN_SIZE = mmap.PAGESIZE
+
+def _find_line(data, needle: bytes, start: int):
+    """
+    Finds the first line of 'data' (bytes or mmap) containing 'needle' at or after
+    'start'. Lines are delimited like in text mode (by '\\n', '\\r' or '\\r\\n').
+
+    Returns:
+        A (line_start, line_end) tuple, or None if the needle is not found.
+    """
+    idx = data.find(needle, start)
+    if idx == -1:
+        return None
+    # Beginning of the line, a lone '\r' is searched only inside it
+    line_start = max(data.rfind(b"\n", start, idx) + 1, start)
+    line_start = max(data.rfind(b"\r", line_start, idx) + 1, line_start)
+    # End of the line
+    line_end = data.find(b"\n", idx + len(needle))
+    if line_end == -1:
+        line_end = len(data)
+    cr = data.find(b"\r", idx + len(needle), line_end)
+    if cr != -1:
+        line_end = cr
+    return line_start, line_end
+
+def _create_temp_file(target_path: Path) -> Path:
+    """
+    Creates a new, uniquely named temporary file next to the target (so it can
+    replace it atomically) and returns its path. Existing files are never reused.
+    """
+    fd, temp_path = tempfile.mkstemp(dir=target_path.parent, prefix="." + target_path.name + ".", suffix=".tmp")
+    os.close(fd)
+    return Path(temp_path)
+
+def _read_data(f):
+    """
+    Returns the contents of a file opened in binary mode, memory-mapped if it is
+    large (the caller must close the returned mmap) or read as bytes otherwise.
+    """
+    if os.fstat(f.fileno()).st_size > _MMAP_MIN_SIZE:
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    return f.read()
+
+def _replace_field_line(line: str, field_name: str, separator: str, separator_regex, value_part: str):
+    """
+    Builds the replacement of a line starting with 'field_name <separator>', keeping
+    its indentation and the spacing around the separator.
+
+    Returns:
+        The new line, or None if the line does not define the field.
+    """
+    stripped_line = line.lstrip() # Remove leading whitespace only
+
+    # Check if the relevant part starts with the field name
+    if stripped_line.startswith(field_name):
+        # Find the actual separator in the stripped line
+        separator_pos = -1
+        temp_line_part = stripped_line[len(field_name):] # Part after field_name
+        separator_pos_in_part = temp_line_part.find(separator.strip())
+
+        if separator_pos_in_part != -1:
+            # Check if the part before the separator is just whitespace
+            part_before_sep = temp_line_part[:separator_pos_in_part].strip()
+            if not part_before_sep: # Ensure only whitespace between field_name and separator
+                separator_pos = len(field_name) + separator_pos_in_part
+                key = stripped_line[:separator_pos].strip() # Extract key to double-check
+
+                if key == field_name:
+                    # Preserve original indentation
+                    indent = len(line) - len(stripped_line)
+                    indentation = ' ' * indent
+
+                    # Construct the new line, preserving original spacing around separator if possible,
+                    # otherwise use ' <separator> '
+                    # Get original spacing around separator
+                    original_separator_with_spacing = temp_line_part[separator_pos_in_part : separator_pos_in_part + len(separator.strip())]
+                    # Reconstruct using original spacing if just the separator, else default spacing
+                    separator_to_write = separator.strip() # Default to no extra space
+                    if original_separator_with_spacing == separator.strip():
+                        # Try to capture original spacing for reconstruction
+                        full_separator_match = temp_line_part[separator_pos_in_part:]
+                        match = separator_regex.match(full_separator_match)
+                        if match:
+                            separator_to_write = match.group(1)
+                        else: # fallback if regex fails somehow
+                            separator_to_write = f" {separator.strip()} "
+                    else: # fallback if structure is unexpected
+                        separator_to_write = f" {separator.strip()} "
+
+                    return f"{indentation}{field_name}{separator_to_write}{value_part}\n"
+    return None
+
+def _replace_field_list_line(line: str, field_name: str, new_values: List[str], separator: str, enclosure: str):
+    """
+    Builds the list block replacing a line starting with 'field_name <separator>',
+    with one enclosed value per line, keeping its indentation.
+
+    Returns:
+        A (new block, in_list) tuple, where in_list tells if the old list continues
+        on the next lines (until a line with only ']'), or None if the line does not
+        define the field.
+    """
+    stripped_line = line.lstrip()
+    separator_pos = stripped_line.find(separator.strip())
+    if separator_pos == -1:
+        return None
+    key = stripped_line[:separator_pos].strip()
+    if key != field_name:
+        return None
+    in_list = False
+    indent = len(line) - len(stripped_line)
+    indentation = ' ' * indent
+    
+    # Check if list starts on same line or next line
+    value_part = stripped_line[separator_pos + len(separator.strip()):].strip()
+    if value_part.startswith('['):
+        # List starts on same line
+        if value_part.strip() == '[':
+            # Only opening bracket, list continues on next lines
+            in_list = True
+        else:
+            # List has content on same line, need to find closing bracket
+            if ']' in value_part:
+                # Single line list, replace entirely
+                pass
+            else:
+                # Multi-line list starting on same line
+                in_list = True
+    
+    # Format list values
+    formatted_values = [f'{indentation}    {enclosure}{val}{enclosure}' for val in new_values]
+    list_content = ',\n'.join(formatted_values)
+    
+    # Create new list block
+    new_line = f"{indentation}{field_name} {separator.strip()} [\n{list_content}\n{indentation}]\n"
+    return new_line, in_list
+
+def _write_field_text(file_path: Path, temp_path: Path, field_name: str, separator: str,
+                      separator_regex, value_part: str) -> bool:
+    """
+    Writes the file to 'temp_path' in text mode (translating newlines), with the first
+    line defining the field replaced. The file is streamed, it is never fully held in memory.
+
+    Returns:
+        True if the field was found (otherwise the temporary file is incomplete).
+    """
+    with open(file_path, "r", encoding="utf-8") as f, \
+         open(temp_path, "w", encoding="utf-8", buffering=_BUFFER_SIZE) as f_out:
+        for line in f:
+            # Lines not containing the field name are copied as they are (a single
+            # C-level substring test, without stripping the line)
+            if field_name not in line:
+                f_out.write(line)
+                continue
+            modified_line = _replace_field_line(line, field_name, separator, separator_regex, value_part)
+            if modified_line is not None:
+                f_out.write(modified_line) # The original line is not written
+                # Copy the rest of the file in large chunks, without splitting it into lines
+                shutil.copyfileobj(f, f_out, _BUFFER_SIZE)
+                f_out.flush()
+                os.fsync(f_out.fileno())
+                return True
+            # Write the original line if it isn't the target line
+            f_out.write(line)
+    return False
 
 class FieldUtils:
     """
@@ -43,23 +217,30 @@ class FieldUtils:
         # Trim the separator for accurate searching
         trimmed_separator = separator.strip()
 
-        with open(file_path, "r", encoding="utf-8") as f:
-            for line in f:
-                stripped_line = line.strip()
-                # Check if the field name is present
-                if field_name in stripped_line:
-                    # Find the position of the separator
-                    separator_pos = stripped_line.find(trimmed_separator)
-                    if separator_pos != -1:
-                        # Extract the key part and check if it matches exactly
-                        key = stripped_line[:separator_pos].strip()
-                        if key == field_name:
-                            # Get the part after the separator and strip whitespace
-                            value_part = stripped_line[separator_pos + len(trimmed_separator):].strip()
-                            # Remove enclosure if it exists at both ends
-                            if enclosure and value_part.startswith(enclosure) and value_part.endswith(enclosure):
-                                value_part = value_part[len(enclosure):-len(enclosure)]
-                            return value_part
+        # The field name is searched for in the raw bytes (a single C-level scan, large
+        # files are memory-mapped), only the lines containing it are decoded
+        needle = field_name.encode("utf-8")
+        with open(file_path, "rb") as f:
+            data = _read_data(f)
+            try:
+                position = 0
+                while (found := _find_line(data, needle, position)) is not None:
+                    line_start, line_end = found
+                    line = data[line_start:line_end].decode("utf-8")
+                    position = line_end + 1
+                    # Split at the first separator in a single pass
+                    key, found_separator, value_part = line.partition(trimmed_separator)
+                    # Check if the key part matches exactly
+                    if found_separator and key.strip() == field_name:
+                        # Strip whitespace around the value
+                        value_part = value_part.strip()
+                        # Remove enclosure if it exists at both ends
+                        if enclosure and value_part.startswith(enclosure) and value_part.endswith(enclosure):
+                            value_part = value_part[len(enclosure):-len(enclosure)]
+                        return value_part
+            finally:
+                if isinstance(data, mmap.mmap):
+                    data.close()
 
         # If the loop finishes without finding the field
         raise ValueError(
@@ -104,38 +285,12 @@ class FieldUtils:
                 stripped_line = line.lstrip()
                 
                 if not line_found and stripped_line.startswith(search_pattern):
-                    separator_pos = stripped_line.find(separator.strip())
-                    if separator_pos != -1:
-                        key = stripped_line[:separator_pos].strip()
-                        if key == field_name:
-                            line_found = True
-                            indent = len(line) - len(stripped_line)
-                            indentation = ' ' * indent
-                            
-                            # Check if list starts on same line or next line
-                            value_part = stripped_line[separator_pos + len(separator.strip()):].strip()
-                            if value_part.startswith('['):
-                                # List starts on same line
-                                if value_part.strip() == '[':
-                                    # Only opening bracket, list continues on next lines
-                                    in_list = True
-                                else:
-                                    # List has content on same line, need to find closing bracket
-                                    if ']' in value_part:
-                                        # Single line list, replace entirely
-                                        pass
-                                    else:
-                                        # Multi-line list starting on same line
-                                        in_list = True
-                            
-                            # Format list values
-                            formatted_values = [f'{indentation}    {enclosure}{val}{enclosure}' for val in new_values]
-                            list_content = ',\n'.join(formatted_values)
-                            
-                            # Create new list block
-                            new_line = f"{indentation}{field_name} {separator.strip()} [\n{list_content}\n{indentation}]\n"
-                            new_lines.append(new_line)
-                            continue
+                    replacement = _replace_field_list_line(line, field_name, new_values, separator, enclosure)
+                    if replacement is not None:
+                        line_found = True
+                        new_line, in_list = replacement
+                        new_lines.append(new_line)
+                        continue
                 
                 # Skip lines inside the old list
                 if in_list:
@@ -180,70 +335,139 @@ class FieldUtils:
         if not file_path.is_file():
             raise FileNotFoundError(f"Target file not found at: {file_path}")
 
-        new_lines: List[str] = []
         line_found = False
-        # Prepare the string to search for at the beginning of the relevant part of the line
-        # We look for the field name, potential whitespace, and the separator
-        search_pattern = f"{field_name}" # Start with field name
+        # Separator with its surrounding whitespace, to preserve the original spacing
+        separator_regex = re.compile(r"(\s*" + re.escape(separator.strip()) + r"\s*)")
+        # Format the value part with enclosure
+        value_part = f"{enclosure}{new_value}{enclosure}"
+
+        # The new content is written to a temporary file next to the target, then it replaces it
+        target_path = Path(os.path.realpath(file_path))
+        temp_path = _create_temp_file(target_path)
+        try:
+            with open(file_path, "rb") as f:
+                data = _read_data(f)
+                try:
+                    # Files with only '\n' newlines are edited as bytes: the field is searched
+                    # for with a C-level scan and the new line is spliced between the
+                    # untouched parts. Other newlines are translated by the text path below.
+                    if os.linesep == "\n" and data.find(b"\r") == -1:
+                        needle = field_name.encode("utf-8")
+                        position = 0
+                        while (found := _find_line(data, needle, position)) is not None:
+                            line_start, line_end = found
+                            position = line_end + 1
+                            # The line is decoded with its newline, like in text mode
+                            line = data[line_start:position].decode("utf-8")
+                            modified_line = _replace_field_line(line, field_name, separator,
+                                                                separator_regex, value_part)
+                            if modified_line is not None:
+                                line_found = True
+                                with open(temp_path, "wb") as f_out, memoryview(data) as view:
+                                    f_out.write(view[:line_start])
+                                    f_out.write(modified_line.encode("utf-8"))
+                                    f_out.write(view[position:])
+                                    f_out.flush()
+                                    os.fsync(f_out.fileno())
+                                break
+                    else:
+                        line_found = _write_field_text(file_path, temp_path, field_name, separator,
+                                                       separator_regex, value_part)
+                finally:
+                    if isinstance(data, mmap.mmap):
+                        data.close()
+
+            if not line_found:
+                raise ValueError(
+                    f"Could not find a line starting with '{field_name}' followed by separator '{separator.strip()}' in {file_path}"
+                )
+
+            # Keep the permissions of the original file
+            shutil.copymode(target_path, temp_path)
+            os.replace(temp_path, target_path)
+        except BaseException:
+            temp_path.unlink(missing_ok=True)
+            raise
+
+    @staticmethod
+    def save_fields(
+        target_file_path: Union[str, Path],
+        fields: Dict[str, str],
+        field_lists: Optional[Dict[str, List[str]]] = None,
+        separator: str = "=",
+        enclosure: str = "\""
+    ) -> None:
+        """
+        Replaces several fields of a file reading and writing it only once: the value
+        of the first line defining each field in 'fields' (like save_field) and the
+        list of the first line defining each field in 'field_lists' (like save_field_list).
+        The file is replaced atomically, it is never left partially written.
+
+        Args:
+            target_file_path: The path to the file to modify.
+            fields: The new value string of each field (key).
+            field_lists: The new list of string values of each field (key).
+            separator: The string separating the keys and values (default: '=').
+            enclosure: The string used to enclose each value (default: '"').
+
+        Raises:
+            FileNotFoundError: If the specified file does not exist.
+            ValueError: If no line defining one of the fields is found.
+        """
+        file_path = Path(target_file_path)
+        if not file_path.is_file():
+            raise FileNotFoundError(f"Target file not found at: {file_path}")
+
+        # Fields still to be found, each one is replaced only once
+        pending_values = {name: f"{enclosure}{value}{enclosure}" for name, value in fields.items()}
+        pending_lists = dict(field_lists or {})
+        # Separator with its surrounding whitespace, to preserve the original spacing
+        separator_regex = re.compile(r"(\s*" + re.escape(separator.strip()) + r"\s*)")
 
+        new_lines: List[str] = []
+        in_list = False
         with open(file_path, "r", encoding="utf-8") as f:
             for line in f:
-                stripped_line = line.lstrip() # Remove leading whitespace only
+                # Skip lines inside a replaced list
+                if in_list:
+                    if line.strip() == ']':
+                        in_list = False
+                    continue
 
-                # Check if the relevant part starts with the field name
-                if not line_found and stripped_line.startswith(search_pattern):
-                    # Find the actual separator in the stripped line
-                    separator_pos = -1
-                    temp_line_part = stripped_line[len(field_name):] # Part after field_name
-                    separator_pos_in_part = temp_line_part.find(separator.strip())
-
-                    if separator_pos_in_part != -1:
-                         # Check if the part before the separator is just whitespace
-                         part_before_sep = temp_line_part[:separator_pos_in_part].strip()
-                         if not part_before_sep: # Ensure only whitespace between field_name and separator
-                            separator_pos = len(field_name) + separator_pos_in_part
-                            key = stripped_line[:separator_pos].strip() # Extract key to double-check
-
-                            if key == field_name:
-                                line_found = True
-                                # Preserve original indentation
-                                indent = len(line) - len(stripped_line)
-                                indentation = ' ' * indent
-
-                                # Format the value part with enclosure
-                                value_part = f"{enclosure}{new_value}{enclosure}"
-
-                                # Construct the new line, preserving original spacing around separator if possible,
-                                # otherwise use ' <separator> '
-                                # Get original spacing around separator
-                                original_separator_with_spacing = temp_line_part[separator_pos_in_part : separator_pos_in_part + len(separator.strip())]
-                                # Reconstruct using original spacing if just the separator, else default spacing
-                                separator_to_write = separator.strip() # Default to no extra space
-                                if original_separator_with_spacing == separator.strip():
-                                    # Try to capture original spacing for reconstruction
-                                    full_separator_match = temp_line_part[separator_pos_in_part:]
-                                    import re
-                                    match = re.match(r"(\s*" + re.escape(separator.strip()) + r"\s*)", full_separator_match)
-                                    if match:
-                                        separator_to_write = match.group(1)
-                                    else: # fallback if regex fails somehow
-                                        separator_to_write = f" {separator.strip()} "
-                                else: # fallback if structure is unexpected
-                                    separator_to_write = f" {separator.strip()} "
-
-
-                                modified_line = f"{indentation}{field_name}{separator_to_write}{value_part}\n"
-                                new_lines.append(modified_line)
-                                continue # Skip appending the original line
-
-                # Append the original line if it wasn't the target line or if target was already processed
-                new_lines.append(line)
+                new_line = None
+                for field_name, new_values in pending_lists.items():
+                    if line.lstrip().startswith(field_name):
+                        replacement = _replace_field_list_line(line, field_name, new_values, separator, enclosure)
+                        if replacement is not None:
+                            new_line, in_list = replacement
+                            del pending_lists[field_name]
+                            break
+                if new_line is None:
+                    for field_name, value_part in pending_values.items():
+                        if field_name in line:
+                            new_line = _replace_field_line(line, field_name, separator, separator_regex, value_part)
+                            if new_line is not None:
+                                del pending_values[field_name]
+                                break
+                new_lines.append(line if new_line is None else new_line)
 
-        if not line_found:
+        if pending_values or pending_lists:
+            missing = ", ".join(f"'{name}'" for name in [*pending_values, *pending_lists])
             raise ValueError(
-                f"Could not find a line starting with '{field_name}' followed by separator '{separator.strip()}' in {file_path}"
+                f"Could not find a line starting with {missing} followed by separator '{separator.strip()}' in {file_path}"
             )
 
-        # Write the modified content back to the file
-        with open(file_path, "w", encoding="utf-8") as f:
-            f.writelines(new_lines)
\ No newline at end of file
+        # Written to a temporary file next to the target, then it replaces it
+        target_path = Path(os.path.realpath(file_path))
+        temp_path = _create_temp_file(target_path)
+        try:
+            with open(temp_path, "w", encoding="utf-8") as f_out:
+                f_out.writelines(new_lines)
+                f_out.flush()
+                os.fsync(f_out.fileno())
+            # Keep the permissions of the original file
+            shutil.copymode(target_path, temp_path)
+            os.replace(temp_path, target_path)
+        except BaseException:
+            temp_path.unlink(missing_ok=True)
+            raise
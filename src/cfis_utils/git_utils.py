@@ -1,146 +1,555 @@
 # Standard libraries
-import re
-from typing import Optional, List, Tuple
+import datetime
+import functools
+import os
+import zlib
+from typing import Optional, List, Tuple, Dict, Any, Callable
+# Third-party libraries (optional, used for fast read-only queries if installed)
+try:
+    import pygit2
+except ImportError:
+    pygit2 = None
 # Local imports
 from . import TerminalUtils
 
+# Number of submodules fetched in parallel by fetch/pull
+_FETCH_JOBS = os.cpu_count() or 1
+
+# Cached query results: {(absolute path, query name): (repository state, result)}
+_query_cache: Dict[Tuple[str, str], Tuple[tuple, Any]] = {}
+
+def _get_git_dir(path: str) -> Optional[str]:
+    """
+    Returns the git directory of a repository root ('<path>/.git', or the directory
+    a '.git' file points to for worktrees/submodules), or None if it is not found.
+    """
+    dot_git = os.path.join(path, ".git")
+    if os.path.isdir(dot_git):
+        return dot_git
+    try:
+        with open(dot_git, "r", encoding="utf-8") as f:
+            content = f.read().strip()
+    except OSError:
+        return None
+    if not content.startswith("gitdir:"):
+        return None
+    git_dir = content[len("gitdir:"):].strip()
+    return git_dir if os.path.isabs(git_dir) else os.path.normpath(os.path.join(path, git_dir))
+
+def _get_repository_state(git_dir: str) -> tuple:
+    """
+    Returns the resolved HEAD and the modification times of the files/directories
+    that change when refs change. Git updates refs through lock files that are
+    renamed into place, which also updates the modification time of the containing
+    directory, so every directory below refs/heads, refs/tags and refs/remotes is
+    included (e.g. refs/heads/feature for the branch 'feature/x').
+    """
+    state = []
+    for relative_path in ("FETCH_HEAD", "packed-refs"):
+        try:
+            state.append(os.stat(os.path.join(git_dir, relative_path)).st_mtime_ns)
+        except OSError:
+            state.append(None)
+    # HEAD and the commit id of the ref it points to
+    head = _read_head(git_dir)
+    state.append(head)
+    if head is not None and head.startswith("ref: "):
+        try:
+            with open(os.path.join(git_dir, head[len("ref: "):]), "r", encoding="utf-8") as f:
+                state.append(f.read().strip())
+        except OSError:
+            state.append(None)
+    for relative_path in ("refs/heads", "refs/tags", "refs/remotes"):
+        for directory, _, _ in os.walk(os.path.join(git_dir, relative_path)):
+            try:
+                state.append((directory, os.stat(directory).st_mtime_ns))
+            except OSError:
+                pass
+    return tuple(state)
+
+def _read_head(git_dir: str) -> Optional[str]:
+    """
+    Returns the content of the HEAD file ('ref: refs/heads/<branch>' or, when
+    detached, the commit hash), or None if it can't be read.
+    """
+    try:
+        with open(os.path.join(git_dir, "HEAD"), "r", encoding="utf-8") as f:
+            return f.read().strip()
+    except OSError:
+        return None
+
+def _is_object_id(value: str) -> bool:
+    """
+    Returns True if the value is a full SHA-1 or SHA-256 object id.
+    """
+    if len(value) not in (40, 64):
+        return False
+    try:
+        int(value, 16)
+    except ValueError:
+        return False
+    return True
+
+def _read_packed_refs(git_dir: str) -> Optional[Dict[str, str]]:
+    """
+    Returns {ref name: peeled object id} from the packed-refs file (the commit an
+    annotated tag points to, the object id itself otherwise), an empty dict if
+    there is no packed-refs file, or None if the file doesn't record peeled ids.
+    """
+    try:
+        with open(os.path.join(git_dir, "packed-refs"), "r", encoding="utf-8") as f:
+            lines = f.read().splitlines()
+    except FileNotFoundError:
+        return {}
+    except OSError:
+        return None
+    # Without the 'peeled' trait, annotated tags can't be told apart from lightweight ones
+    if not lines or not lines[0].startswith("# pack-refs with:") or "peeled" not in lines[0].split():
+        if any(line and not line.startswith("#") for line in lines):
+            return None
+        return {}
+    refs = {}
+    ref_name = None
+    for line in lines[1:]:
+        if line.startswith("^"):
+            # Peeled id of the previous (annotated tag) ref
+            if ref_name is not None:
+                refs[ref_name] = line[1:]
+        elif line:
+            object_id, _, ref_name = line.partition(" ")
+            refs[ref_name] = object_id
+    return refs
+
+def _peel_loose_object(git_dir: str, object_id: str) -> Optional[str]:
+    """
+    Returns the object an annotated tag points to if the loose object is a tag, the
+    object id itself for any other object type, or None if it can't be determined
+    (packed object, nested tags, ...).
+    """
+    try:
+        with open(os.path.join(git_dir, "objects", object_id[:2], object_id[2:]), "rb") as f:
+            # The header and the first lines of a tag fit in the first few hundred bytes
+            data = zlib.decompressobj().decompress(f.read(1024))
+    except (OSError, zlib.error):
+        return None
+    if not data.startswith(b"tag "):
+        return object_id
+    # Tag object: 'tag <size>\0object <id>\ntype <type>\n...'
+    lines = data.partition(b"\0")[2].split(b"\n", 2)
+    if len(lines) < 3 or not lines[0].startswith(b"object ") or lines[1] != b"type commit":
+        return None
+    return lines[0][len(b"object "):].decode("ascii")
+
+def _get_exact_tag(git_dir: str) -> Optional[str]:
+    """
+    Returns the name of the only tag pointing to the HEAD commit, reading the ref files
+    directly (no git process), or None if there isn't exactly one such tag or it can't
+    be determined from the files (e.g. linked worktrees, packed tag objects).
+    """
+    # Linked worktrees keep their refs in a common directory
+    if os.path.exists(os.path.join(git_dir, "commondir")):
+        return None
+    head = _read_head(git_dir)
+    packed_refs = _read_packed_refs(git_dir)
+    if head is None or packed_refs is None:
+        return None
+    # Resolve HEAD to a commit id
+    if head.startswith("ref: "):
+        ref_name = head[len("ref: "):]
+        try:
+            with open(os.path.join(git_dir, ref_name), "r", encoding="utf-8") as f:
+                head_id = f.read().strip()
+        except OSError:
+            head_id = packed_refs.get(ref_name)
+    else:
+        head_id = head
+    if head_id is None or not _is_object_id(head_id):
+        return None
+
+    # Tags: packed ones are already peeled, loose ones (which override them) are not
+    tags = {name: (object_id, True) for name, object_id in packed_refs.items() if name.startswith("refs/tags/")}
+    directories = [os.path.join(git_dir, "refs", "tags")]
+    while directories:
+        try:
+            with os.scandir(directories.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir():
+                        directories.append(entry.path)
+                        continue
+                    with open(entry.path, "r", encoding="utf-8") as f:
+                        object_id = f.read().strip()
+                    name = "refs/tags/" + os.path.relpath(entry.path, os.path.join(git_dir, "refs", "tags")).replace(os.sep, "/")
+                    tags[name] = (object_id, False)
+        except FileNotFoundError:
+            continue
+        except OSError:
+            return None
+
+    matches = []
+    for name, (object_id, peeled) in tags.items():
+        if object_id != head_id and not peeled:
+            # A lightweight tag of another object or an annotated tag, which may point to HEAD
+            if not _is_object_id(object_id):
+                return None
+            object_id = _peel_loose_object(git_dir, object_id)
+            if object_id is None:
+                return None
+        if object_id == head_id:
+            matches.append(name[len("refs/tags/"):])
+    return matches[0] if len(matches) == 1 else None
+
+def _cached_query(func: Callable) -> Callable:
+    """
+    Caches the (non-None) result of a GitUtils query per repository path. The cached
+    result is reused until the repository refs change (see _get_repository_state)
+    or GitUtils.invalidate_cache is called. Paths that are not the root of a
+    repository and linked worktrees (whose refs live in a common directory) are
+    not cached.
+    """
+    @functools.wraps(func)
+    def wrapper(path: str):
+        absolute_path = os.path.abspath(str(path))
+        git_dir = _get_git_dir(absolute_path)
+        if git_dir is None or os.path.exists(os.path.join(git_dir, "commondir")):
+            return func(path)
+        state = _get_repository_state(git_dir)
+        key = (absolute_path, func.__name__)
+        cached = _query_cache.get(key)
+        if cached is not None and cached[0] == state:
+            result = cached[1]
+        else:
+            result = func(path)
+            if result is not None:
+                _query_cache[key] = (state, result)
+        # Return copies of lists, so callers can't modify the cached value
+        return list(result) if isinstance(result, list) else result
+    return wrapper
+
 
 class GitUtils:
+    """
+    Utility class for git operations.
+    Read-only queries use libgit2 through pygit2 when it is installed (no git process
+    is spawned), otherwise, and for every other operation, the git command is used.
+    """
+
+    _repositories: Dict[str, "pygit2.Repository"] = {} # pygit2 repositories by absolute path
+
+    @staticmethod
+    def _open_repository(path: str) -> Optional["pygit2.Repository"]:
+        """
+        Returns a (cached) pygit2 repository for the path, or None if pygit2 is not
+        installed or the path is not inside a git repository.
+        """
+        if pygit2 is None:
+            return None
+        key = os.path.abspath(str(path))
+        repository = GitUtils._repositories.get(key)
+        if repository is None:
+            try:
+                repository = pygit2.Repository(key)
+            except (pygit2.GitError, KeyError, ValueError):
+                return None
+            GitUtils._repositories[key] = repository
+        return repository
+
+    @staticmethod
+    def invalidate_cache(path: Optional[str] = None) -> None:
+        """
+        Forgets the cached query results (branches, tags) of a repository,
+        or of all repositories if no path is given.
+        """
+        if path is None:
+            _query_cache.clear()
+            return
+        absolute_path = os.path.abspath(str(path))
+        for key in [key for key in _query_cache if key[0] == absolute_path]:
+            del _query_cache[key]
+
+    @staticmethod
+    def _git(path: str, *args: str, interactive: bool = False, modifies_refs: bool = False) -> TerminalUtils.CommandResult:
+        """
+        Run a git command on the repository at the given path.
+        Uses 'git -C <path>' with an argument list, so no shell is spawned.
+        If 'modifies_refs' is True, the cached query results of the repository are invalidated.
+        """
+        result = TerminalUtils.run_command(["git", "-C", str(path), *args], interactive=interactive)
+        if modifies_refs:
+            GitUtils.invalidate_cache(path)
+        return result
     
     @staticmethod
     def clone(repo_url: str, path: str) -> TerminalUtils.CommandResult:
         """
         Clone a git repository to the specified path.
         """
-        return TerminalUtils.run_command(f"cd {path} && git clone {repo_url} .", interactive=True)
+        return GitUtils._git(path, "clone", repo_url, ".", interactive=True, modifies_refs=True)
     
     @staticmethod
     def checkout(branch: str, path:  str) -> TerminalUtils.CommandResult:
         """
         Checkout a specific branch in the git repository.
         """
-        return TerminalUtils.run_command(f"cd {path} && git checkout {branch}", interactive=False)
+        return GitUtils._git(path, "checkout", branch, modifies_refs=True)
     
     @staticmethod
     def pull(path: str) -> TerminalUtils.CommandResult:
         """
         Pull the latest changes from the remote repository.
+        Submodules are fetched in parallel ('--jobs').
         """
-        return TerminalUtils.run_command(f"cd {path} && git pull", interactive=True)
+        return GitUtils._git(path, "pull", f"--jobs={_FETCH_JOBS}", interactive=True, modifies_refs=True)
     
     @staticmethod
+    @_cached_query
     def get_remote_branches(path: str) -> Optional[List[str]]:
         """
         Get the list of remote branches in the git repository.
         """
-        result =  TerminalUtils.run_command(f"cd {path} && git branch -r", interactive=False)
-        if result.exit_code != 0:
+        repository = GitUtils._open_repository(path)
+        if repository is not None:
+            try:
+                # Names are '<remote>/<branch>', sorted like git does (by ref name)
+                branches = (name.partition("/")[2] for name in sorted(repository.branches.remote))
+                return [branch for branch in branches if branch and branch != "HEAD"]
+            except pygit2.GitError:
+                pass # Fall back to the git command
+        refs = GitUtils._get_refs(path)
+        if refs is None:
             return None
-        branches = [ "/".join(x.strip().split('/')[1:]) for x in result.stdout.splitlines() if "HEAD" not in x]
-        return branches
+        # Sorted by ref name, like 'git for-each-ref refs/remotes/'
+        # Remove the 'refs/remotes/<remote>/' prefix
+        branches = (ref_name[len("refs/remotes/"):].partition("/")[2]
+                    for ref_name in sorted(ref_name for ref_name, _ in refs if ref_name.startswith("refs/remotes/")))
+        return [branch for branch in branches if branch and branch != "HEAD"]
 
     @staticmethod
+    @_cached_query
     def get_current_branch(path: str) -> Optional[str]:
         """
         Get the current branch in the git repository.
         """
-        result = TerminalUtils.run_command(f"cd {path} && git branch --show-current", interactive=False)
+        # Read HEAD directly when possible (no git process)
+        git_dir = _get_git_dir(os.path.abspath(str(path)))
+        head = _read_head(git_dir) if git_dir is not None else None
+        if head is not None:
+            if head.startswith("ref: refs/heads/"):
+                return head[len("ref: refs/heads/"):]
+            if _is_object_id(head):
+                return "" # Detached HEAD
+        repository = GitUtils._open_repository(path)
+        if repository is not None:
+            try:
+                # HEAD is a symbolic reference to 'refs/heads/<branch>', unless detached
+                head_target = repository.references["HEAD"].target
+                if isinstance(head_target, str) and head_target.startswith("refs/heads/"):
+                    return head_target[len("refs/heads/"):]
+                return ""
+            except (pygit2.GitError, KeyError):
+                pass # Fall back to the git command
+        result = GitUtils._git(path, "branch", "--show-current")
         if result.exit_code != 0:
             return None
         return result.stdout.strip()
 
     @staticmethod
+    @_cached_query
     def get_current_tag(path: str) -> Optional[str]:
         """
         Get the current tag in the git repository.
         """
-        result = TerminalUtils.run_command(f"cd {path} && git describe --tags", interactive=False)
+        # If HEAD is exactly at a tag, read the ref files directly (no git process)
+        git_dir = _get_git_dir(os.path.abspath(str(path)))
+        if git_dir is not None:
+            tag = _get_exact_tag(git_dir)
+            if tag is not None:
+                return tag
+        result = GitUtils._git(path, "describe", "--tags")
         if result.exit_code != 0:
             return None
         return result.stdout.strip()
 
     @staticmethod
+    @_cached_query
     def get_tags(path: str) -> Optional[List[str]]:
         """
         Get the list of tags in the git repository.
         """
-        result = TerminalUtils.run_command(f"cd {path} && git --no-pager tag --sort=-creatordate", interactive=False)
+        repository = GitUtils._open_repository(path)
+        if repository is not None:
+            try:
+                return [name for name, _ in GitUtils._get_tags_pygit2(repository)]
+            except (pygit2.GitError, KeyError):
+                pass # Fall back to the git command
+        refs = GitUtils._get_refs(path)
+        if refs is None:
+            return None
+        return [ref_name[len("refs/tags/"):] for ref_name, _ in refs if ref_name.startswith("refs/tags/")]
+
+    @staticmethod
+    @_cached_query
+    def get_tags_with_dates(path: str) -> Optional[List[Tuple[str, datetime.datetime]]]:
+        """
+        Get the list of tags in the git repository with their creation dates, newest first.
+        The creation date is the tagger date for annotated tags and the commit date otherwise.
+        All the dates are obtained in a single query (not one git process per tag).
+        """
+        repository = GitUtils._open_repository(path)
+        if repository is not None:
+            try:
+                return GitUtils._get_tags_pygit2(repository)
+            except (pygit2.GitError, KeyError):
+                pass # Fall back to the git command
+        refs = GitUtils._get_refs(path)
+        if refs is None:
+            return None
+        tags = []
+        for ref_name, date in refs:
+            if ref_name.startswith("refs/tags/"):
+                # fromisoformat only accepts 'Z' from Python 3.11
+                if date.endswith("Z"):
+                    date = date[:-1] + "+00:00"
+                tags.append((ref_name[len("refs/tags/"):], datetime.datetime.fromisoformat(date)))
+        return tags
+
+    @staticmethod
+    @_cached_query
+    def _get_refs(path: str) -> Optional[List[Tuple[str, str]]]:
+        """
+        Returns the full names and creation dates (ISO 8601 strings) of all the tags and
+        remote branches, newest first (ties sorted by name).
+        A single git process serves get_tags, get_tags_with_dates and get_remote_branches,
+        and its result is cached, so calling several of them doesn't spawn one process each.
+        """
+        result = GitUtils._git(path, "for-each-ref", "--sort=-creatordate",
+                               "--format=%(refname) %(creatordate:iso-strict)", "refs/tags/", "refs/remotes/")
         if result.exit_code != 0:
             return None
-        tags = result.stdout.splitlines()
-        return [tag.strip() for tag in tags if tag.strip()]
+        refs = []
+        for line in result.stdout.splitlines():
+            # Ref names can't contain spaces
+            ref_name, _, date = line.partition(" ")
+            if ref_name:
+                refs.append((ref_name, date))
+        return refs
+
+    @staticmethod
+    def _get_tags_pygit2(repository: "pygit2.Repository") -> List[Tuple[str, datetime.datetime]]:
+        """
+        Returns the tags of a pygit2 repository with their creation dates, newest first
+        (like 'git tag --sort=-creatordate', ties sorted by name).
+        The creation date is the tagger date for annotated tags and the commit date otherwise.
+        """
+        tags = []
+        for ref_name in repository.references:
+            if not ref_name.startswith("refs/tags/"):
+                continue
+            target = repository[repository.references[ref_name].target]
+            if isinstance(target, pygit2.Tag) and target.tagger is not None:
+                created, offset = target.tagger.time, target.tagger.offset
+            elif isinstance(target, pygit2.Commit):
+                created, offset = target.commit_time, target.commit_time_offset
+            else:
+                created, offset = 0, 0
+            tags.append((-created, ref_name[len("refs/tags/"):], offset))
+        tags.sort()
+        return [
+            (name, datetime.datetime.fromtimestamp(-created, datetime.timezone(datetime.timedelta(minutes=offset))))
+            for created, name, offset in tags
+        ]
 
     @staticmethod
     def fetch(path: str) -> TerminalUtils.CommandResult:
         """
         Fetch changes from the remote repository.
+        Submodules are fetched in parallel ('--jobs').
         """
-        return TerminalUtils.run_command(f"cd {path} && git fetch", interactive=True)
+        return GitUtils._git(path, "fetch", f"--jobs={_FETCH_JOBS}", interactive=True, modifies_refs=True)
     
     @staticmethod
     def create_tag(tag_name: str, path: str) -> TerminalUtils.CommandResult:
         """
         Create a new lightweight tag in the git repository.
         """
-        return TerminalUtils.run_command(f"cd {path} && git tag {tag_name}", interactive=False)
+        return GitUtils._git(path, "tag", tag_name, modifies_refs=True)
 
     @staticmethod
     def push_tag(tag_name: str, path: str) -> TerminalUtils.CommandResult:
         """
         Push a specific tag to the remote repository (assumed 'origin').
         """
-        return TerminalUtils.run_command(f"cd {path} && git push origin {tag_name}", interactive=True)
+        return GitUtils._git(path, "push", "origin", tag_name, interactive=True, modifies_refs=True)
 
     @staticmethod
     def check_sync_status(path: str) -> Tuple[bool, str]:
         """
         Checks if the working directory/staging area are clean AND if the branch
-        is synchronized with its remote counterpart using 'git status -sb'.
+        is synchronized with its remote counterpart using 'git status --porcelain=v2 --branch'.
 
         Returns:
             bool: True if clean (no file changes AND branch is not ahead/behind remote), False otherwise.
             str: Status message ("clean", "uncommitted changes or untracked files",
                  "branch is ahead or behind remote", "error").
         """
-        # 1. Run git status -sb
-        command = f"cd {path} && git status -sb"
-        status_result = TerminalUtils.run_command(command, interactive=False)
+        repository = GitUtils._open_repository(path)
+        if repository is not None:
+            try:
+                return GitUtils._check_sync_status_pygit2(repository)
+            except (pygit2.GitError, KeyError):
+                pass # Fall back to the git command
+
+        # 1. Run git status in the machine readable format
+        status_result = GitUtils._git(path, "status", "--porcelain=v2", "--branch")
 
         if status_result.exit_code != 0:
-            error_msg = f"error: 'git status -sb' failed. Stderr: {status_result.stderr.strip()}"
+            error_msg = f"error: 'git status --porcelain=v2 --branch' failed. Stderr: {status_result.stderr.strip()}"
             return False, error_msg
 
-        # 2. Check the output.
-        output_lines = status_result.stdout.strip().splitlines()
-
-        if not output_lines:
-             final_status = "error: no output from 'git status -sb'"
-             is_clean = False
-             return is_clean, final_status
-
-        # Check for file changes (any line other than the first '##' line)
-        if len(output_lines) > 1:
-            final_status = "uncommitted changes or untracked files"
-            is_clean = False
-        # If only the branch status line exists, check if it's ahead or behind
-        elif output_lines[0].startswith("##"):
-            branch_status_line = output_lines[0]
-            # Use regex to check for [ahead N] or [behind M]
-            if re.search(r"\[(ahead|behind) \d+\]", branch_status_line):
-                final_status = "branch is ahead or behind remote"
-                is_clean = False
-            else:
-                # Only the branch line, and it's not ahead/behind
-                final_status = "clean"
-                is_clean = True
-        else:
-            # Unexpected output format (e.g., doesn't start with ##)
-             final_status = "error: unexpected output format from 'git status -sb'"
-             is_clean = False
+        # 2. Check the output without splitting it into lines.
+        # Header lines start with '#' and come first, any other line is a changed or
+        # untracked file, so the working tree is clean if the last line is a header.
+        output = status_result.stdout.rstrip("\n")
+        last_line = output[output.rfind("\n") + 1:]
+        if last_line and not last_line.startswith("#"):
+            return False, "uncommitted changes or untracked files"
 
-        # Return
-        return is_clean, final_status
+        # The '# branch.ab +<ahead> -<behind>' header is only present if there is an upstream.
+        ahead = behind = 0
+        start = output.find("# branch.ab ")
+        if start != -1:
+            end = output.find("\n", start)
+            parts = output[start:end if end != -1 else len(output)].split(" ")
+            try:
+                ahead = int(parts[2][1:])
+                behind = int(parts[3][1:])
+            except (IndexError, ValueError):
+                return False, "error: unexpected output format from 'git status --porcelain=v2 --branch'"
+
+        if ahead or behind:
+            return False, "branch is ahead or behind remote"
+        return True, "clean"
     
+    @staticmethod
+    def _check_sync_status_pygit2(repository: "pygit2.Repository") -> Tuple[bool, str]:
+        """
+        pygit2 version of check_sync_status, see it for the returned values.
+        """
+        # 1. Any file that is not current (and not ignored) means uncommitted changes
+        for flags in repository.status().values():
+            if flags != pygit2.GIT_STATUS_CURRENT and not flags & pygit2.GIT_STATUS_IGNORED:
+                return False, "uncommitted changes or untracked files"
+
+        # 2. Compare the branch with its upstream, if any
+        if repository.head_is_detached or repository.head_is_unborn:
+            return True, "clean"
+        branch = repository.branches.local.get(repository.head.shorthand)
+        upstream = branch.upstream if branch is not None else None
+        if upstream is not None:
+            ahead, behind = repository.ahead_behind(branch.target, upstream.target)
+            if ahead or behind:
+                return False, "branch is ahead or behind remote"
+        return True, "clean"
+
     @staticmethod
     def commit_all(path: str, message: str) -> TerminalUtils.CommandResult:
         """
@@ -155,12 +564,40 @@ class GitUtils:
             message (str): The commit message.
 
         Returns:
-            CommandResult: The result object from the 'git commit' command execution. 
-                            Note: 'git add' success is implicit if commit runs.
+            CommandResult: The result object from the 'git commit' command execution,
+                            or from 'git add' if staging failed.
+        """
+        add_result = GitUtils._git(path, "add", ".")
+        if add_result.exit_code != 0:
+            return add_result
+        # The message is passed as a single argument, no escaping needed
+        return GitUtils._git(path, "commit", "-m", message.strip(), modifies_refs=True)
+
+    @staticmethod
+    def commit_push_tag(path: str, message: str, tag_name: str, remote: str = "origin") -> TerminalUtils.CommandResult:
+        """
+        Commits all the changes, creates a lightweight tag on the new commit and pushes
+        the current branch together with the tag to the remote in a single
+        'git push --atomic <remote> HEAD <tag>' (one connection and, if needed, one
+        authentication instead of separate branch and tag pushes).
+
+        Args:
+            path (str): The path to the root of the git repository.
+            message (str): The commit message.
+            tag_name (str): The name of the tag to create and push.
+            remote (str): The name of the remote repository (defaults to 'origin').
+
+        Returns:
+            CommandResult: The result of the first step that failed, or of the push if all succeeded.
         """
-        message = message.strip().replace("\"", "\\\"")
-        command = f'git add . && git commit -m "{message}"' 
-        return TerminalUtils.run_command(command, cwd=path, interactive=False)
+        result = GitUtils.commit_all(path, message)
+        if result.exit_code != 0:
+            return result
+        result = GitUtils.create_tag(tag_name, path)
+        if result.exit_code != 0:
+            return result
+        # Atomic, so the branch and the tag are either both updated on the remote or neither
+        return GitUtils._git(path, "push", "--atomic", remote, "HEAD", tag_name, interactive=True, modifies_refs=True)
 
     @staticmethod
     def push(path: str, remote: Optional[str] = "origin", branch: Optional[str] = None):
@@ -184,7 +621,7 @@ class GitUtils:
         Returns:
             CommandResult: The result object from the 'git push' command execution.
         """
-        cmd_parts = ["git", "push"] # Command parts list
+        cmd_parts = ["push"] # Command parts list
         
         # Add remote if specified (use default 'origin' otherwise for clarity)
         cmd_parts.append(remote if remote else "origin") 
@@ -194,5 +631,4 @@ class GitUtils:
             cmd_parts.append(branch) 
         
         # Push often requires credentials or passphrase, hence interactive=True
-        # Run from the specified repository path using cwd parameter
-        return TerminalUtils.run_command(cmd_parts, cwd=path, interactive=True)
\ No newline at end of file
+        return GitUtils._git(path, *cmd_parts, interactive=True, modifies_refs=True)
\ No newline at end of file
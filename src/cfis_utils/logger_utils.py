@@ -1,24 +1,276 @@
 # Standard libraries
+import atexit
 import logging
+import os
+import queue
 import sys
-import traceback
+import threading
 from pathlib import Path
-from logging.handlers import RotatingFileHandler
-from typing import Union, Optional, Any 
+from logging.handlers import RotatingFileHandler, QueueHandler, QueueListener
+from typing import Union, Optional, Any, Dict, List, Tuple
 import re
 # Third-party libraries
-import colorlog
 import colorama
 
-# Initialize colorama for Windows compatibility
-colorama.init()
+def _colors_forced() -> bool:
+    """
+    Checks if colored output is forced with the FORCE_COLOR environment variable
+    (and not disabled with NO_COLOR).
+    """
+    return not os.environ.get("NO_COLOR") and os.environ.get("FORCE_COLOR", "0") != "0"
+
+# Initialize colorama for Windows compatibility. It strips ANSI codes from streams
+# that are not a terminal, so keep them when colors are forced
+colorama.init(strip=False if _colors_forced() else None)
+
+# The log format does not use thread/process information, so skip collecting it
+# for every record
+logging.logThreads = False
+logging.logProcesses = False
+logging.logMultiprocessing = False
+
+# Environment variable that overrides the level of newly configured loggers
+_LOG_LEVEL_ENV_VAR = "CFIS_LOG_LEVEL"
+
+# ANSI color escape sequences (e.g. '\x1b[31m'), compiled once
+_ANSI_COLOR_RE = re.compile(r'\x1b\[[0-9;]*m')
+_ANSI_COLOR_BYTES_RE = re.compile(rb'\x1b\[[0-9;]*m')
+
+# Level initials precomputed for the standard levels, keyed by level number
+_LEVEL_INITIALS = {
+    logging.DEBUG: 'D', logging.INFO: 'I', logging.WARNING: 'W',
+    logging.ERROR: 'E', logging.CRITICAL: 'C', logging.NOTSET: 'N',
+}
 
 # Define a filter to add the level initial to the log record
 class _LevelInitialFilter(logging.Filter):
     """Adds 'levelinitial' attribute to log records."""
     def filter(self, record):
-        record.levelinitial = record.levelname[0].upper() if record.levelname else '?'
+        initial = _LEVEL_INITIALS.get(record.levelno)
+        if initial is None:
+            # Custom level names are not cached
+            initial = record.levelname[0].upper() if record.levelname else '?'
+        record.levelinitial = initial
+        return True
+
+# Filter instance shared by all the handlers
+_level_initial_filter = _LevelInitialFilter()
+
+# Stream handler with an upper level bound (used for stdout, records >= ERROR go to stderr)
+class _MaxLevelStreamHandler(logging.StreamHandler):
+    """
+    StreamHandler that drops records at or above max_level with a single
+    comparison, before running the filters.
+    """
+    def __init__(self, stream, max_level: int):
+        super().__init__(stream)
+        self.max_level = max_level
+
+    def handle(self, record):
+        if record.levelno >= self.max_level:
+            return False
+        return super().handle(record)
+
+# Rotating file handler that tracks the file size instead of querying the stream
+class _SizeTrackingRotatingFileHandler(RotatingFileHandler):
+    """
+    RotatingFileHandler that keeps a running count of the bytes written, so the
+    rollover check does not need to seek/tell (or stat) the file on every record.
+    Each record is also formatted only once.
+    """
+    def __init__(self, *args, **kwargs):
+        self._bytes_written = 0
+        super().__init__(*args, **kwargs)
+        # See bpo-45401: Never rollover anything other than regular files
+        self._can_rollover = not (os.path.exists(self.baseFilename) and not os.path.isfile(self.baseFilename))
+
+    def _open(self):
+        stream = super()._open()
+        # Start counting from the current size of the file
+        stream.seek(0, 2)
+        self._bytes_written = stream.tell()
+        return stream
+
+    def _encoded_size(self, msg: str) -> int:
+        """
+        Returns the number of bytes the message takes in the file. The text stream
+        translates '\n' to os.linesep ('\r\n' on Windows) when writing.
+        """
+        size = len(msg.encode(self.encoding or 'utf-8'))
+        if os.linesep != '\n':
+            size += msg.count('\n') * (len(os.linesep) - 1)
+        return size
+
+    def _would_overflow(self, size: int) -> bool:
+        return self._can_rollover and self.maxBytes > 0 and self._bytes_written + size >= self.maxBytes
+
+    def shouldRollover(self, record):
+        msg = self.format(record) + self.terminator
+        return self._would_overflow(self._encoded_size(msg))
+
+    def emit(self, record):
+        try:
+            msg = self.format(record) + self.terminator
+            size = self._encoded_size(msg)
+            if self.stream is None:
+                self.stream = self._open()
+            if self._would_overflow(size):
+                self.doRollover()
+                if self.stream is None:
+                    self.stream = self._open()
+            self.stream.write(msg)
+            self.flush()
+            self._bytes_written += size
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+# Formatter and console handlers shared by all the configured loggers (created on first use)
+_file_formatter: Optional[logging.Formatter] = None
+_console_handlers: Optional[List[logging.Handler]] = None
+
+def _use_colors(stream) -> bool:
+    """
+    Checks if colored output should be used for the given stream: only when it is a
+    terminal, unless overridden with the NO_COLOR / FORCE_COLOR environment variables.
+    """
+    if os.environ.get("NO_COLOR"):
+        return False
+    if _colors_forced():
         return True
+    try:
+        return stream.isatty()
+    except (AttributeError, ValueError):
+        return False
+
+def _get_shared_handlers() -> Tuple[logging.Formatter, List[logging.Handler]]:
+    """
+    Returns the shared file formatter and console handlers, creating them on first use.
+    They are not created at import time because the separator depends on the
+    terminal encoding, obtained from TerminalUtils.
+    """
+    global _file_formatter, _console_handlers
+    if _console_handlers is None:
+        # Choose separator based on terminal encoding
+        try:
+            from . import TerminalUtils
+            separator = '»' if TerminalUtils.get_terminal_encoding() == 'utf-8' else '>'
+        except ImportError:
+            separator = '>'  # Fallback
+        # str.format style ('{'), cheaper than '%' style for every record
+        log_format = f'[{{asctime}}][{{levelinitial}}] {separator} {{message}}'
+        date_format = '%Y-%m-%d %H:%M:%S'
+        _file_formatter = logging.Formatter(log_format, datefmt=date_format, style='{')
+        # Colored formatter, only created (and colorlog imported) if a console stream is a terminal
+        stdout_colors = _use_colors(sys.stdout)
+        stderr_colors = _use_colors(sys.stderr)
+        console_formatter = _file_formatter
+        if stdout_colors or stderr_colors:
+            import colorlog
+            level_log_colors = {
+                'DEBUG':    'cyan', 'INFO':     'green', 'WARNING':  'yellow',
+                'ERROR':    'red', 'CRITICAL': 'red,bold',
+            }
+            console_formatter = colorlog.ColoredFormatter(
+                f'{{log_color}}{log_format}{{reset}}',
+                datefmt=date_format, log_colors=level_log_colors, reset=True, style='{'
+            )
+
+        # Plain formatting when the output is not a terminal (pipes, files, CI logs)
+        stdout_handler = _MaxLevelStreamHandler(sys.stdout, logging.ERROR)
+        stdout_handler.setFormatter(console_formatter if stdout_colors else _file_formatter)
+        stdout_handler.addFilter(_level_initial_filter)
+
+        stderr_handler = logging.StreamHandler(sys.stderr)
+        stderr_handler.setFormatter(console_formatter if stderr_colors else _file_formatter)
+        stderr_handler.setLevel(logging.ERROR)
+        stderr_handler.addFilter(_level_initial_filter)
+
+        _console_handlers = [stdout_handler, stderr_handler]
+    return _file_formatter, _console_handlers
+
+# Serializes logger configuration, so concurrent calls do not add handlers twice
+_configure_lock = threading.Lock()
+
+class _DispatchHandler(logging.Handler):
+    """
+    Passes each record to the file handler of the configured logger that queued it
+    (see _LoggerQueueHandler), if that logger has one.
+    """
+    def __init__(self):
+        super().__init__()
+        self.file_handlers: Dict[str, logging.Handler] = {} # File handlers by logger name
+
+    def handle(self, record):
+        handler = self.file_handlers.get(getattr(record, "_configured_logger", None))
+        if handler is not None and record.levelno >= handler.level:
+            handler.handle(record)
+        return True
+
+class _LoggerQueueHandler(QueueHandler):
+    """
+    QueueHandler that tags the records with the name of the configured logger, so
+    the shared listener can route them to its file handler. In a forked child,
+    where the listener thread doesn't exist, records are handled synchronously.
+    """
+    def __init__(self, log_queue, logger_name: str):
+        super().__init__(log_queue)
+        self.logger_name = logger_name
+
+    def prepare(self, record):
+        record = super().prepare(record)
+        record._configured_logger = self.logger_name
+        return record
+
+    def emit(self, record):
+        if not _synchronous:
+            super().emit(record)
+            return
+        try:
+            record._configured_logger = self.logger_name
+            _listener.handle(record)
+        except Exception:
+            self.handleError(record)
+
+# Single background listener owning the real (I/O) handlers of all the configured
+# loggers, fed by one queue so records keep their order across loggers
+_log_queue = queue.SimpleQueue()
+_dispatch_handler = _DispatchHandler()
+_listener: Optional[QueueListener] = None
+# Records are handled in the logging thread instead of the listener: in a forked
+# child (no listener thread, and it may exit with os._exit skipping atexit) and
+# after the listener is stopped at exit
+_synchronous = False
+
+def _start_listener(console_handlers: List[logging.Handler]) -> None:
+    """
+    Creates and starts the shared listener on first use.
+    Must be called with _configure_lock held.
+    """
+    global _listener
+    if _listener is None:
+        _listener = QueueListener(_log_queue, *console_handlers, _dispatch_handler, respect_handler_level=True)
+        if not _synchronous:
+            _listener.start()
+
+def _stop_listener() -> None:
+    """Flushes and stops the background log listener."""
+    global _synchronous
+    if _listener is not None and not _synchronous:
+        _synchronous = True
+        _listener.stop()
+
+def _after_fork_in_child() -> None:
+    """Switches a forked child to synchronous logging (the listener thread is not forked)."""
+    global _synchronous, _configure_lock
+    _synchronous = True
+    _configure_lock = threading.Lock()
+
+# Make sure queued records are written before the interpreter exits
+atexit.register(_stop_listener)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_after_fork_in_child)
 
 class LoggerUtils:
     """
@@ -27,6 +279,7 @@ class LoggerUtils:
     Also sets up global uncaught exception logging.
     """
     _last_logger_name: Optional[str] = None # Stores the name of the last logger requested
+    _configured_loggers: Dict[str, logging.Logger] = {} # Loggers configured by this class, by name
 
     @staticmethod
     def get_logger(name: Optional[str] = None,
@@ -51,7 +304,11 @@ class LoggerUtils:
         - The name used for the new logger is 'name' if provided, otherwise 'logger'.
         - Uses the format: [asctime][name][LevelInitial] » message
         - Handles colored console output (stdout for <ERROR, stderr for >=ERROR)
-          and optional rotating file logging.
+          and optional rotating file logging. Colors are only used when the
+          console stream is a terminal (see the NO_COLOR / FORCE_COLOR variables).
+        - The logger only enqueues records; formatting and I/O are performed by a
+          background QueueListener thread shared by all the loggers, so logging
+          calls do not block on the terminal or the disk.
 
         Args:
             name (str | None, optional): The name for the logger instance.
@@ -59,7 +316,8 @@ class LoggerUtils:
                                          then defaults to 'logger' when configuring
                                          a new one. Defaults to None.
             level (int, optional): The minimum logging level for a newly configured logger.
-                                 Defaults to logging.DEBUG.
+                                 Defaults to logging.DEBUG. It can be overridden with
+                                 the CFIS_LOG_LEVEL environment variable (e.g. 'INFO').
             file_path (str | Path | None, optional): If provided, logs will also be
                                                     written to this file when configuring
                                                     a new logger. Defaults to None.
@@ -73,6 +331,16 @@ class LoggerUtils:
             logging.Logger: A configured logger instance (either existing or new).
         """
 
+        # 0. Fast path for loggers already configured here, skipping the logging
+        #    module lock and the hasHandlers() walk up the hierarchy
+        cached_name = name if name is not None else LoggerUtils._last_logger_name
+        if cached_name is not None:
+            logger_candidate = LoggerUtils._configured_loggers.get(cached_name)
+            # Configured loggers do not propagate, so their own handlers are enough
+            if logger_candidate is not None and logger_candidate.handlers:
+                LoggerUtils._last_logger_name = cached_name
+                return logger_candidate
+
         # 1. Check for existing logger by provided name
         if name is not None:
             logger_candidate = logging.getLogger(name)
@@ -102,60 +370,68 @@ class LoggerUtils:
         # (This check prevents re-configuration if getLogger returned an
         # existing but unconfigured logger placeholder)
         if not logger_to_configure.hasHandlers():
-            logger_to_configure.setLevel(level)
-            logger_to_configure.addFilter(_LevelInitialFilter())
-
-            # Formatters
-            # Choose separator based on terminal encoding
-            try:
-                from . import TerminalUtils
-                separator = '»' if TerminalUtils.get_terminal_encoding() == 'utf-8' else '>'
-            except ImportError:
-                separator = '>'  # Fallback
-            log_format = f'[%(asctime)s][%(levelinitial)s] {separator} %(message)s'
-            date_format = '%Y-%m-%d %H:%M:%S'
-            file_formatter = logging.Formatter(log_format, datefmt=date_format)
-            level_log_colors = {
-                'DEBUG':    'cyan', 'INFO':     'green', 'WARNING':  'yellow',
-                'ERROR':    'red', 'CRITICAL': 'red,bold',
-            }
-            console_formatter = colorlog.ColoredFormatter(
-                f'%(log_color)s{log_format}%(reset)s',
-                datefmt=date_format, log_colors=level_log_colors, reset=True
-            )
+            with _configure_lock:
+                # Check again, another thread may have configured it meanwhile
+                if not logger_to_configure.hasHandlers():
+                    LoggerUtils._configure_logger(logger_to_configure, level, file_path,
+                                                  file_max_bytes, file_backup_count)
+                    LoggerUtils._configured_loggers[effective_name] = logger_to_configure
 
-            # Console Handlers (stdout < ERROR, stderr >= ERROR)
-            stdout_handler = logging.StreamHandler(sys.stdout)
-            stdout_handler.setFormatter(console_formatter)
-            stdout_handler.addFilter(lambda record: record.levelno < logging.ERROR)
-            logger_to_configure.addHandler(stdout_handler)
-
-            stderr_handler = logging.StreamHandler(sys.stderr)
-            stderr_handler.setFormatter(console_formatter)
-            stderr_handler.setLevel(logging.ERROR)
-            logger_to_configure.addHandler(stderr_handler)
-
-            # Optional File Handler
-            if file_path is not None:
-                if isinstance(file_path, Path):
-                    file_path.parent.mkdir(parents=True, exist_ok=True)
-                else:
-                    Path(file_path).parent.mkdir(parents=True, exist_ok=True)
-
-                file_handler = RotatingFileHandler(
-                    filename=file_path, maxBytes=file_max_bytes,
-                    backupCount=file_backup_count, encoding='utf-8'
-                )
-                file_handler.setFormatter(file_formatter)
-                file_handler.setLevel(level)
-                logger_to_configure.addHandler(file_handler)
-
-            # Prevent propagation for non-root loggers
-            if logger_to_configure.name != "root":
-                 logger_to_configure.propagate = False
-                 
         return logger_to_configure
 
+    @staticmethod
+    def _configure_logger(logger: logging.Logger,
+                          level: int,
+                          file_path: Optional[Union[str, Path]],
+                          file_max_bytes: int,
+                          file_backup_count: int
+                          ) -> None:
+        """
+        Configures the level and handlers of a logger without handlers.
+        Must be called with _configure_lock held.
+        """
+        # Allow the level to be overridden from the environment
+        env_level = os.environ.get(_LOG_LEVEL_ENV_VAR)
+        if env_level:
+            env_level = env_level.strip().upper()
+            env_level = int(env_level) if env_level.isdigit() else logging.getLevelName(env_level)
+            if isinstance(env_level, int):
+                level = env_level
+        logger.setLevel(level)
+
+        # Prevent propagation for non-root loggers
+        if logger.name != "root":
+            logger.propagate = False
+
+        # Formatters and console handlers (stdout < ERROR, stderr >= ERROR),
+        # shared by all the configured loggers
+        file_formatter, console_handlers = _get_shared_handlers()
+
+        # Optional File Handler
+        file_handler = None
+        if file_path is not None:
+            file_path = Path(file_path)
+            # Only walk up the tree creating directories if the parent is missing
+            if not file_path.parent.is_dir():
+                file_path.parent.mkdir(parents=True, exist_ok=True)
+
+            file_handler = _SizeTrackingRotatingFileHandler(
+                filename=file_path, maxBytes=file_max_bytes,
+                backupCount=file_backup_count, encoding='utf-8'
+            )
+            file_handler.setFormatter(file_formatter)
+            file_handler.setLevel(level)
+            file_handler.addFilter(_level_initial_filter)
+
+        # The real handlers run in the shared background thread fed by a queue,
+        # the logger itself only gets the (non-blocking) queue handler
+        if file_handler is not None:
+            _dispatch_handler.file_handlers[logger.name] = file_handler
+        else:
+            _dispatch_handler.file_handlers.pop(logger.name, None)
+        _start_listener(console_handlers)
+        logger.addHandler(_LoggerQueueHandler(_log_queue, logger.name))
+
     @staticmethod
     def remove_color_codes(text: str) -> str:
         """
@@ -167,20 +443,47 @@ class LoggerUtils:
         Returns:
             str: The text without the color codes
         """
-        ansi_escape = re.compile(r'\x1b\[[0-9;]*m')
-        return ansi_escape.sub('', text)
+        # Most texts have no escape sequences, checking for ESC is much cheaper than a regex search
+        if '\x1b' not in text:
+            return text
+        return _ANSI_COLOR_RE.sub('', text)
+
+    @staticmethod
+    def remove_color_codes_bytes(data: bytes) -> bytes:
+        """
+        Remove ANSI color codes from the given bytes (e.g. the raw contents of a log file),
+        without decoding them. Same result as remove_color_codes on the decoded text.
+
+        Args:
+            data (bytes): The bytes to remove the color codes from
+
+        Returns:
+            bytes: The bytes without the color codes
+        """
+        # Same fast path as for text, most data has no escape sequences
+        if b'\x1b' not in data:
+            return bytes(data)
+        return _ANSI_COLOR_BYTES_RE.sub(b'', data)
 
 # --- Uncaught Exception Handling ---
 def _handle_uncaught_exception(exc_type, exc_value, exc_traceback):
     """
     Logs uncaught exceptions using the last requested logger name.
+    If no logger was ever requested, the default hook prints the traceback instead.
     This function is assigned to sys.excepthook to handle errors globally.
     """
+    # Do not configure a new logger (handlers, colors, listener thread) while the
+    # process is dying just to print one message
+    if LoggerUtils._last_logger_name is None:
+        sys.__excepthook__(exc_type, exc_value, exc_traceback)
+        return
     logger = LoggerUtils.get_logger(name=LoggerUtils._last_logger_name)
-    tb_lines = traceback.format_exception(exc_type, exc_value, exc_traceback)
-    traceback_str = "".join(tb_lines)
-    message = f"Uncaught exception:\n{traceback_str}"
-    logger.critical(message)
+    # Do not format the traceback if the logger would drop it, use the default hook instead
+    if not logger.isEnabledFor(logging.CRITICAL):
+        sys.__excepthook__(exc_type, exc_value, exc_traceback)
+        return
+    # The traceback is formatted by the logging machinery, only once per record
+    logger.critical("Uncaught exception:", exc_info=(exc_type, exc_value, exc_traceback))
 
 # Set the global exception hook to our custom handler
 # This ensures that any unhandled exception triggers the logging function
@@ -1,148 +1,248 @@
 # Standard libraries
+import functools
+import os
 import platform
 import shutil
+import sys
+from typing import Dict, Iterable, Optional
 # Local libraries
 from . import TerminalUtils
 
+# Cache of shutil.which() lookups, keyed on the binary name
+_which_cache: Dict[str, Optional[str]] = {}
+
+def _which(binary: str) -> Optional[str]:
+    """Returns the cached shutil.which() result for a binary."""
+    try:
+        return _which_cache[binary]
+    except KeyError:
+        path = _which_cache[binary] = shutil.which(binary)
+        return path
+
+def _compute_system() -> str:
+    """Returns the operating system name ('Windows', 'Linux', 'Mac')."""
+    # sys.platform is a constant, platform.system() calls uname (and may spawn
+    # 'cmd /c ver' on Windows), so it is only used for the less common systems
+    if sys.platform == 'win32':
+        return 'Windows'
+    if sys.platform.startswith('linux'):
+        return 'Linux'
+    if sys.platform == 'darwin':
+        return 'Mac'
+    # Any other system name is returned as it is
+    return platform.system()
+
+# The operating system can't change while the process runs, it is detected once at import
+_SYSTEM = _compute_system()
+_IS_WINDOWS = _SYSTEM == 'Windows'
+_IS_LINUX = _SYSTEM == 'Linux'
+_IS_MAC = _SYSTEM == 'Mac'
+
+@functools.lru_cache(maxsize=None)
+def _get_package_manager() -> Optional[str]:
+    """
+    Returns the package manager used to query the installed packages ('apt' or 'dnf'
+    on Linux, 'brew' on macOS), or None if there isn't a supported one.
+    """
+    if _IS_LINUX:
+        if _which('apt') is not None:
+            return 'apt'
+        if _which('dnf') is not None:
+            return 'dnf'
+    elif _IS_MAC and _which('brew') is not None:
+        return 'brew'
+    return None
+
+# Commands querying an installed package by its exact name (appended), by package manager
+_PACKAGE_QUERY_COMMANDS = {
+    # 'dpkg -s' also succeeds for removed packages whose configuration files remain
+    'apt': ['dpkg-query', '--show', '--showformat=${Status}'],
+    # Querying the rpm database directly avoids starting dnf
+    'dnf': ['rpm', '--query'],
+    'brew': ['brew', 'list', '--versions'],
+}
+# Commands listing the installed packages, by package manager
+_PACKAGE_LIST_COMMANDS = {
+    'apt': ['dpkg-query', '--show', '--showformat=${Package} ${Status}\n'],
+    'dnf': ['rpm', '--query', '--all', '--queryformat=%{NAME}\n'],
+    'brew': ['brew', 'list', '-1'],
+}
+
+@functools.lru_cache(maxsize=None)
+def _get_architecture() -> str:
+    """Returns the machine type (e.g., 'x86_64', 'AMD64', 'arm64')."""
+    # Same values platform.machine() returns, without computing the rest of platform.uname()
+    # (which may run subprocesses, e.g. 'uname -p' on Python 3.8)
+    if _IS_WINDOWS:
+        # Set by Windows for every process, PROCESSOR_ARCHITEW6432 holds the native
+        # architecture when a 32-bit Python runs on a 64-bit system
+        return (os.environ.get('PROCESSOR_ARCHITEW6432') or os.environ.get('PROCESSOR_ARCHITECTURE')
+                or platform.machine())
+    if hasattr(os, 'uname'):
+        return os.uname().machine
+    return platform.machine()
+
+# Machine types of 64-bit and 32-bit architectures
+_ARCHITECTURES_64BIT = frozenset(('x86_64', 'AMD64', 'arm64', 'aarch64'))
+_ARCHITECTURES_32BIT = frozenset(('x86', 'i386', 'i686'))
+
 class OSUtils:
     """
     Provides utility functions to determine OS details like type,
     package manager, and architecture.
+    The results never change while the process runs, so they are computed once.
     """
     @staticmethod
     def get_system():
         """Returns the operating system name ('Windows', 'Linux', 'Mac')."""
-        system = platform.system()
-        if system == 'Windows':
-            return 'Windows'
-        elif system == 'Linux':
-            return 'Linux'
-        elif system == 'Darwin':
-            return 'Mac'
-        else:
-            return system # Return the system name if it's something else
+        return _SYSTEM
 
     @staticmethod
     def is_windows():
         """Checks if the current operating system is Windows."""
-        return OSUtils.get_system() == 'Windows'
+        return _IS_WINDOWS
 
     @staticmethod
     def is_linux():
         """Checks if the current operating system is Linux."""
-        return OSUtils.get_system() == 'Linux'
+        return _IS_LINUX
 
     @staticmethod
     def is_mac():
         """Checks if the current operating system is macOS."""
-        return OSUtils.get_system() == 'Mac'
+        return _IS_MAC
 
     @staticmethod
+    @functools.lru_cache(maxsize=None)
     def has_apt():
         """
         Checks if the 'apt' package manager is available.
         Only relevant on Linux. Returns False otherwise.
         """
-        if OSUtils.is_linux():
-            return shutil.which('apt') is not None
+        if _IS_LINUX:
+            return _which('apt') is not None
         return False
 
     @staticmethod
+    @functools.lru_cache(maxsize=None)
     def has_dnf():
         """
         Checks if the 'dnf' package manager is available.
         Only relevant on Linux. Returns False otherwise.
         """
-        if OSUtils.is_linux():
-            return shutil.which('dnf') is not None
+        if _IS_LINUX:
+            return _which('dnf') is not None
         return False
 
     @staticmethod
+    @functools.lru_cache(maxsize=None)
     def has_brew():
         """
         Checks if the 'brew' package manager (Homebrew) is available.
         Only relevant on macOS. Returns False otherwise.
         """
-        if OSUtils.is_mac():
-            return shutil.which('brew') is not None
+        if _IS_MAC:
+            return _which('brew') is not None
         return False
 
     @staticmethod
-    def get_architecture():
-        """Returns the machine type (e.g., 'x86_64', 'AMD64', 'arm64')."""
-        return platform.machine()
-    
+    def clear_which_cache():
+        """
+        Forgets the cached executable lookups, so the package managers are searched
+        for on PATH again (e.g. after installing one or changing PATH).
+        """
+        _which_cache.clear()
+        OSUtils.has_apt.cache_clear()
+        OSUtils.has_dnf.cache_clear()
+        OSUtils.has_brew.cache_clear()
+        _get_package_manager.cache_clear()
+
+    get_architecture = staticmethod(_get_architecture)
+
     @staticmethod
+    @functools.lru_cache(maxsize=None)
     def is_64bit():
         """
         Checks if the architecture is 64-bit.
-        Returns True for 'x86_64', 'AMD64', and 'arm64'.
+        Returns True for 'x86_64', 'AMD64', 'arm64' and 'aarch64' (64-bit ARM on Linux).
         """
-        arch = OSUtils.get_architecture()
-        return arch in ['x86_64', 'AMD64', 'arm64']
+        return _get_architecture() in _ARCHITECTURES_64BIT
     
     @staticmethod
+    @functools.lru_cache(maxsize=None)
     def is_32bit():
         """
         Checks if the architecture is 32-bit.
         Returns True for 'x86', 'i386', and 'i686'.
         """
-        arch = OSUtils.get_architecture()
-        return arch in ['x86', 'i386', 'i686']
+        return _get_architecture() in _ARCHITECTURES_32BIT
     
     @staticmethod
     def has_installed(package_name: str) -> bool:
         """
         Checks if a package/formula is installed using the system's package manager
-        (supports dpkg via apt and dnf on Linux; brew on macOS) by querying
-        installed packages and filtering with grep.
+        (dpkg on Linux with apt, rpm on Linux with dnf, brew on macOS), querying the
+        package by its exact name. The package manager is run directly, without a shell.
 
         Only functional on Linux or macOS systems.
 
         Args:
-            package_name: The name of the package/formula to check (case-insensitive search).
+            package_name: The exact name of the package/formula to check
+                          (e.g. 'libusb-1.0-0' with apt, 'libusb1' with dnf).
 
         Returns:
-            True if the package seems installed (grep found matches),
-            False otherwise.
+            True if the package is installed, False otherwise.
         """
-        # Check if on a supported OS (Linux or Mac) first
-        if not (OSUtils.is_linux() or OSUtils.is_mac()):
+        # Only apt/dnf on Linux and brew on macOS are supported
+        package_manager = _get_package_manager()
+        if package_manager is None:
             return False
 
-        # Initialize command variable
-        command = ""
-
-        # Determine command based on OS and available package manager
-        if OSUtils.is_linux():
-            if OSUtils.has_apt():
-                command = f"dpkg -l | grep -i {package_name}"
-            elif OSUtils.has_dnf():
-                command = f"dnf list installed | grep -i {package_name}"
-            else:
-                return False
-        elif OSUtils.is_mac():
-            if OSUtils.has_brew():
-                command = f"brew list | grep -i {package_name}"
-            else:
-                return False
-
-        # If no command was set, return False
-        if not command:
+        # Execute the query, exit code 0 means the package is known to the package manager
+        result = TerminalUtils.run_command([*_PACKAGE_QUERY_COMMANDS[package_manager], package_name])
+        if result.exit_code != 0:
             return False
+        # dpkg also knows packages that are not installed (e.g. 'deinstall ok config-files')
+        if package_manager == 'apt':
+            return result.stdout.endswith(' installed')
+        return True
 
-        # Execute the command and capture the output
-        result = TerminalUtils.run_command(command)
-        # Exit code 0 means the command ran AND grep found at least one match
-        if result.exit_code == 0:
-            return True
-        # Exit code 1 typically means grep ran successfully but found no matches
-        elif result.exit_code == 1:
-            return False
-        # Any other non-zero exit code indicates an error (e.g., dpkg/dnf/brew failed)
+    @staticmethod
+    def has_installed_many(package_names: Iterable[str]) -> Dict[str, bool]:
+        """
+        Checks if several packages/formulas are installed, with a single call to the
+        system's package manager listing the installed packages (dpkg-query on Linux
+        with apt, rpm on Linux with dnf, brew on macOS), instead of one call per package.
+
+        Only functional on Linux or macOS systems.
+
+        Args:
+            package_names: The exact names of the packages/formulas to check.
+
+        Returns:
+            A dictionary mapping each package name to True if it is installed,
+            False otherwise.
+        """
+        package_names = list(package_names)
+        # Only apt/dnf on Linux and brew on macOS are supported
+        package_manager = _get_package_manager()
+        if not package_names or package_manager is None:
+            return dict.fromkeys(package_names, False)
+
+        result = TerminalUtils.run_command(_PACKAGE_LIST_COMMANDS[package_manager])
+        if result.exit_code != 0:
+            return dict.fromkeys(package_names, False)
+        if package_manager == 'apt':
+            # dpkg also lists packages that are not installed (e.g. 'deinstall ok config-files')
+            installed = set()
+            for line in result.stdout.splitlines():
+                name, _, status = line.partition(' ')
+                if status.endswith(' installed'):
+                    installed.add(name)
         else:
-            return False
-        
+            installed = set(result.stdout.split())
+        return {name: name in installed for name in package_names}
+
 if __name__ == "__main__":
     # Example usage
-    print(OSUtils.has_installed("python"))
\ No newline at end of file
+    print(OSUtils.has_installed("python3"))
\ No newline at end of file
@@ -1,65 +1,59 @@
 # Standard libraries
 from pathlib import Path
+from typing import List, Union
 import logging
-# Local imports
-from . import LoggerUtils, GitUtils, VersionUtils, FieldUtils
+import re
+
+# git requirement (e.g. git+https://github.com/user/repo.git), capturing the package
+# name: the last part of the URL without the .git extension
+_GIT_REQUIREMENT_RE = re.compile(r"(?=git\+)(?:.*/)?(?P<name>[^/]*?)(?:\.git)?")
 
 class PublishUtils():
 
     @staticmethod
-    def _sync_requirements_to_toml(requirements_path: str, toml_file_path: str, logger: logging.Logger = None) -> None:
+    def _read_requirements(requirements_path: Union[str, Path], logger: logging.Logger = None) -> List[str]:
         """
-        Synchronizes dependencies from requirements.txt to pyproject.toml.
+        Reads the dependencies from requirements.txt in the pyproject.toml format.
         
         Args:
-            requirements_path (str): Path to the requirements.txt file.
-            toml_file_path (str): Path to the pyproject.toml file.
+            requirements_path (str | Path): Path to the requirements.txt file.
             logger (logging.Logger, optional): Logger instance to use.
+
+        Returns:
+            List[str]: The dependencies, git requirements as 'package-name @ git+url'.
         
         Raises:
-            FileNotFoundError: If requirements.txt or pyproject.toml is not found.
+            FileNotFoundError: If requirements.txt is not found.
         """
+        # Local imports, only the modules needed to read the requirements
+        from . import LoggerUtils
         logger = logger or LoggerUtils.get_logger()
         
         requirements_file = Path(requirements_path)
-        toml_file = Path(toml_file_path)
-        
         if not requirements_file.is_file():
             raise FileNotFoundError(f"Requirements file not found at: {requirements_file}")
-        if not toml_file.is_file():
-            raise FileNotFoundError(f"TOML file not found at: {toml_file}")
         
         # Read requirements.txt
         logger.info(f"Reading requirements from: {requirements_file}")
         with open(requirements_file, 'r', encoding='utf-8') as f:
-            requirements = [line.strip() for line in f.readlines() if line.strip() and not line.startswith('#')]
+            # Single pass over the lines, each one is stripped once
+            requirements = [stripped for line in f if (stripped := line.strip()) and not line.startswith('#')]
         
         # Convert git dependencies to pyproject.toml format
+        # Example: git+https://github.com/user/repo.git -> repo @ git+https://github.com/user/repo.git
         toml_dependencies = []
         for requirement in requirements:
-            if requirement.startswith('git+'):
-                # Extract package name from git URL
-                # Example: git+https://github.com/user/repo.git -> repo
-                git_url = requirement
-                if git_url.endswith('.git'):
-                    repo_name = git_url.split('/')[-1][:-4]  # Remove .git extension
-                else:
-                    repo_name = git_url.split('/')[-1]
-                
+            # A single regex pass checks for a git URL and extracts the package name
+            match = _GIT_REQUIREMENT_RE.fullmatch(requirement)
+            if match:
                 # Format for pyproject.toml: "package-name @ git+url"
-                toml_format = f'{repo_name} @ {git_url}'
-                toml_dependencies.append(toml_format)
+                toml_dependencies.append(f"{match['name']} @ {requirement}")
             else:
                 toml_dependencies.append(requirement)
-        
-        # Update dependencies in pyproject.toml using FieldUtils
-        logger.info(f"Updating dependencies in: {toml_file}")
-        FieldUtils.save_field_list(toml_file, "dependencies", toml_dependencies)
-        
-        logger.info(f"Successfully synced {len(toml_dependencies)} dependencies to {toml_file}")
+        return toml_dependencies
 
     @staticmethod
-    def publish_new_python_package_version(toml_file_path: str, readme_file_path: str, repository_path: str, requirements_path: str, logger: logging.Logger = None) -> None:
+    def publish_new_python_package_version(toml_file_path: Union[str, Path], readme_file_path: Union[str, Path], repository_path: Union[str, Path], requirements_path: Union[str, Path], logger: logging.Logger = None) -> None:
         """
         Publishes a new version of a Python package.
 
@@ -74,48 +68,47 @@ class PublishUtils():
           `dd` is the day, and `xx` is a two-digit number representing the daily increment.
 
         Args:
-            toml_file_path (str): The path to the pyproject.toml file.
-            readme_file_path (str): The path to the README.md file.
+            toml_file_path (str | Path): The path to the pyproject.toml file.
+            readme_file_path (str | Path): The path to the README.md file.
             repository_path (str): The path to the Git repository.
             requirements_path (str): Path to requirements.txt file to sync dependencies.
             logger (logging.Logger, optional): Logger instance to use. If None, a new logger is created.
 
         Raises:
             FileNotFoundError: If the pyproject.toml file is not found.
-            RuntimeError: If the Git repository is not in a clean state.
+            RuntimeError: If the Git repository is not in a clean state, or if committing,
+                          tagging or pushing the new version fails.
         """
+        # Local imports, the release tooling is only loaded when publishing
+        from . import LoggerUtils, GitUtils, VersionUtils, FieldUtils
         # Get logger
         logger = logger or LoggerUtils.get_logger()
-        # Toml file path
-        toml_file_path = Path("pyproject.toml")
-        # Readme file path
-        readme_file_path = Path("README.md")
+        # Toml and readme file paths, as given by the caller
+        toml_file_path = Path(toml_file_path)
+        readme_file_path = Path(readme_file_path)
         if not toml_file_path.is_file():
             raise FileNotFoundError(f"Configuration file not found at: {toml_file_path}")
         # Check git status
         is_clean, final_status = GitUtils.check_sync_status(repository_path)
         if not is_clean:
             raise RuntimeError(f"Git status check failed: {final_status}")
-        # Sync requirements to pyproject.toml dependencies
-        logger.info("Syncing requirements.txt to pyproject.toml dependencies")
-        PublishUtils._sync_requirements_to_toml(requirements_path, toml_file_path, logger)
+        # Dependencies from requirements.txt, synced to pyproject.toml with the version
+        toml_dependencies = PublishUtils._read_requirements(requirements_path, logger)
         # Get current version
-        current_version = FieldUtils.get_field(toml_file_path, "version", "=", "\"")
+        current_version = VersionUtils.get_version(toml_file_path)
         logger.info(f"Current version: {current_version}")
         # Increment version
         new_version = VersionUtils.increment_version(current_version)
         logger.info(f"New version: {new_version}")
-        # Update version in toml and readme files
-        logger.info(f"Updating version in {toml_file_path} and {readme_file_path}")
-        FieldUtils.save_field(toml_file_path, "version", new_version, "=", "\"")
+        # Update dependencies and version in the toml file (rewritten once) and version in the readme file
+        logger.info(f"Syncing {len(toml_dependencies)} dependencies and updating version in {toml_file_path}")
+        FieldUtils.save_fields(toml_file_path, {"version": new_version}, {"dependencies": toml_dependencies})
+        logger.info(f"Updating version in {readme_file_path}")
         FieldUtils.save_field(readme_file_path, "**Latest stable tag**", new_version, ": ", "")
-        # Commit and push changes
-        logger.info("Committing changes")
-        GitUtils.commit_all(repository_path, f"Update version to {new_version}")
-        GitUtils.push(repository_path)
-        # Generate and push a new tag
-        logger.info(f"Generating and pushing tag {new_version}")
-        GitUtils.create_tag(new_version, repository_path)
-        GitUtils.push_tag(new_version, repository_path)
+        # Commit the changes, tag them and push both in a single push
+        logger.info(f"Committing changes and pushing them with tag {new_version}")
+        result = GitUtils.commit_push_tag(repository_path, f"Update version to {new_version}", new_version)
+        if result.exit_code != 0:
+            raise RuntimeError(f"Failed to commit, tag and push version {new_version}:\n{result}")
         # Final message
         logger.info(f"Version {new_version} has been successfully published.")
\ No newline at end of file
@@ -4,8 +4,6 @@ from typing import Union, List, Tuple
 import numbers
 # Third-party libraries
 import numpy as np
-import matplotlib.pyplot as plt
-from matplotlib.animation import FuncAnimation
 
 class ScanUtils():
 
@@ -90,42 +88,38 @@ class ScanUtils():
         y_coords_base = np.linspace(start_np[1], target_np[1], num=num_y)
         z_coords = np.linspace(start_np[2], target_np[2], num=num_z)
 
-        points_abs_list = []
-        # Iterate through Z planes
-        for z_idx, z in enumerate(z_coords):
-            # Determine Y direction based on z_idx (plane index)
-            if z_idx % 2 == 0:  # Even Z index: sweep Y forwards
-                y_coords_iter = y_coords_base
-                y_indices = range(num_y) # Original indices (0 to num_y-1)
-            else:              # Odd Z index: sweep Y backwards
-                y_coords_iter = y_coords_base[::-1] # Reversed Y coordinates
-                y_indices = range(num_y - 1, -1, -1) # Original indices in reverse order
-
-            # Iterate through Y lines within the current Z plane
-            # y_idx_in_iter is the index within the current y_coords_iter (0 to num_y-1)
-            # y is the actual Y coordinate value
-            for y_idx_in_iter, y in enumerate(y_coords_iter):
-                # effective_y_idx is the index this Y value had in the original y_coords_base
-                effective_y_idx = y_indices[y_idx_in_iter]
-
-                # Determine X direction based on the combined parity of effective_y_idx and z_idx
-                # This ensures the X sweep direction continues correctly across Z planes
-                if (effective_y_idx + z_idx) % 2 == 0: # Even combined index: sweep X forwards
-                    x_coords_iter = x_coords_base
-                else:                                  # Odd combined index: sweep X backwards
-                    x_coords_iter = x_coords_base[::-1]
-
-                # Iterate through X points for the current Y line
-                for x in x_coords_iter:
-                    points_abs_list.append([x, y, z])
-
-        # Convert list to NumPy array and round
-        points_abs_np = np.array(points_abs_list, dtype=float)
-        points_abs_np = np.round(points_abs_np, 4)
+        # Forward and reversed sweeps of each axis, computed once and reused for every line
+        x_fwd = x_coords_base
+        x_rev = np.ascontiguousarray(x_coords_base[::-1])
+        y_fwd = y_coords_base
+        y_rev = np.ascontiguousarray(y_coords_base[::-1])
+
+        # Write the coordinates of every point in scan order, shape (num_z, num_y, num_x, 3):
+        # - Y is swept forwards on even Z planes and backwards on odd ones.
+        # - X is swept forwards when the combined parity of the (original) Y index and the
+        #   Z index is even, backwards otherwise, so the X sweep direction continues
+        #   correctly across Z planes.
+        points_abs_np = np.empty((num_z, num_y, num_x, 3), dtype=float)
+        points_abs_np[0::2, :, :, 1] = y_fwd[:, None]
+        points_abs_np[1::2, :, :, 1] = y_rev[:, None]
+        points_abs_np[..., 2] = z_coords[:, None, None]
+        z_idx = np.arange(num_z)[:, None]
+        y_idx = np.where(z_idx % 2 == 0, np.arange(num_y), np.arange(num_y - 1, -1, -1))
+        x_forwards = (y_idx + z_idx) % 2 == 0 # One flag per X line, shape (num_z, num_y)
+        points_abs_np[x_forwards, :, 0] = x_fwd
+        points_abs_np[~x_forwards, :, 0] = x_rev
+        points_abs_np = points_abs_np.reshape(-1, 3)
+
+        # Round (in place)
+        np.round(points_abs_np, 4, out=points_abs_np)
 
 
         # === Plotting (Animation) ===
         if plot_points > 0:
+            # Imported here, so generating points doesn't pay the matplotlib import cost
+            import matplotlib.pyplot as plt
+            from matplotlib.animation import FuncAnimation
+
             fig = plt.figure(figsize=(8, 8))
             ax = fig.add_subplot(111, projection='3d')
 
@@ -156,14 +150,18 @@ class ScanUtils():
             ax.set_title('Scan Path Animation')
             ax.legend(loc='upper left')
 
+            # Coordinates for the animation as contiguous float32 columns
+            # (single precision is enough for drawing and halves the data copied per frame)
+            xs, ys, zs = np.ascontiguousarray(points_abs_np.T, dtype=np.float32)
+
             # Update function called for each animation frame
+            # set_data_3d keeps the given views (set_data copies them), so updating a frame
+            # does not copy the growing path
             def update(i):
                 # Update the line plot data up to the current frame (i)
-                line.set_data(points_abs_np[:i+1, 0], points_abs_np[:i+1, 1])
-                line.set_3d_properties(points_abs_np[:i+1, 2])
+                line.set_data_3d(xs[:i+1], ys[:i+1], zs[:i+1])
                 # Update the current point marker position to frame i
-                point.set_data([points_abs_np[i, 0]], [points_abs_np[i, 1]])
-                point.set_3d_properties([points_abs_np[i, 2]])
+                point.set_data_3d(xs[i:i+1], ys[i:i+1], zs[i:i+1])
                 # Return the updated plot elements
                 return line, point
 
@@ -178,15 +176,18 @@ class ScanUtils():
 
         # === Return requested coordinate type ===
         if relative:
-            # Calculate differences between consecutive absolute points
-            diffs = np.diff(points_abs_np, axis=0)
-            # Prepend a zero vector for the first point (relative to itself)
-            output = np.vstack((np.zeros((1, 3)), diffs))
+            output = np.empty_like(points_abs_np)
+            # The first point is relative to itself (zero vector)
+            output[0] = 0.0
+            # Differences between consecutive absolute points, written directly into the output
+            np.subtract(points_abs_np[1:], points_abs_np[:-1], out=output[1:])
+            # Round the differences (in place)
+            np.round(output, 4, out=output)
         else:
-            # Return absolute coordinates if relative=False
+            # Return absolute coordinates if relative=False (already rounded)
             output = points_abs_np
-        # Round, convert to list, and return
-        return np.round(output, 4).tolist()
+        # Convert to list and return
+        return output.tolist()
     
 if __name__ == "__main__":
     # Example usage
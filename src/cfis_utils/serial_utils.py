@@ -1,9 +1,24 @@
 # Standard imports
 import logging
+import sys
+from typing import Iterator
 # Local imports
 from . import LoggerUtils
-# Third-party imports
-from serial.tools.list_ports import comports
+
+# Tree lines of a port in log_available_serial_ports (number, name, device, description)
+_PORT_TEMPLATE = (
+    "  ├── Port {0}:\n"
+    "  │   ├── Name        : {1}\n"
+    "  │   ├── Device      : {2}\n"
+    "  │   └── Description : {3}"
+)
+# The last port closes the tree
+_LAST_PORT_TEMPLATE = (
+    "  └── Port {0}:\n"
+    "      ├── Name        : {1}\n"
+    "      ├── Device      : {2}\n"
+    "      └── Description : {3}"
+)
 
 class SerialUtils():
 
@@ -15,6 +30,8 @@ class SerialUtils():
         args:
             logger (logging.Logger, optional): Logger instance to use. If None, a new logger is created.
         """
+        # Imported here, pyserial's port listing backend is only loaded when ports are listed
+        from serial.tools.list_ports import comports
         try:
             ports = list(comports())
         except Exception as e:
@@ -25,6 +42,29 @@ class SerialUtils():
 
         return ports
 
+    @staticmethod
+    def iter_available_serial_ports(logger: logging.Logger = None) -> Iterator:
+        """
+        Yields the available serial ports one at a time, so a caller that stops early
+        does not pay for the rest (on Windows, each port is read from the registry
+        when it is reached). If listing the ports fails, the error is logged and the
+        iteration ends.
+
+        args:
+            logger (logging.Logger, optional): Logger instance to use. If None, a new logger is created.
+        """
+        # Imported here, pyserial's port listing backend is only loaded when ports are listed.
+        # On Windows comports() collects every port in a list, iterate_comports() is lazy
+        if sys.platform == 'win32':
+            from serial.tools.list_ports_windows import iterate_comports as comports
+        else:
+            from serial.tools.list_ports import comports
+        try:
+            yield from comports()
+        except Exception as e:
+            logger = logger or LoggerUtils.get_logger()
+            logger.exception(f"Failed to retrieve serial ports: {e}", exc_info=True)
+
     @staticmethod
     def log_available_serial_ports(logger: logging.Logger = None) -> None:
         """
@@ -34,23 +74,22 @@ class SerialUtils():
             logger (logging.Logger, optional): Logger instance to use. If None, a new logger is created.
         """
         logger = logger or LoggerUtils.get_logger()
+        # Nothing to do (not even listing the ports) if the messages would be discarded
+        if not logger.isEnabledFor(logging.INFO):
+            return
         ports = SerialUtils.get_available_serial_ports(logger)
         if not ports:
             logger.info("[Serial] No serial ports detected.")
         else:
             num_ports = len(ports)
-            logger.info(f"[Serial] Found {num_ports} serial port(s):")
-            # Log details for each port
-            for i, port in enumerate(ports):
-                is_last_port = (i == num_ports - 1)
-                # Determine prefixes based on whether it's the last port
-                port_prefix = "└──" if is_last_port else "├──"
-                detail_indent = "    " if is_last_port else "│   "
-                # Log port number line
-                logger.info(f"  {port_prefix} Port {i+1}:")
-                logger.info(f"  {detail_indent}├── Name        : {port.name}")
-                logger.info(f"  {detail_indent}├── Device      : {port.device}")
-                logger.info(f"  {detail_indent}└── Description : {port.description}")
+            # One formatting call per port, the last port uses the closing branches
+            port_blocks = [
+                (_LAST_PORT_TEMPLATE if i == num_ports else _PORT_TEMPLATE).format(
+                    i, port.name, port.device, port.description)
+                for i, port in enumerate(ports, 1)
+            ]
+            # A single record for the whole list
+            logger.info("\n".join([f"[Serial] Found {num_ports} serial port(s):", *port_blocks]))
 
 if __name__ == "__main__":
     # Example usage
@@ -87,6 +87,9 @@ class TerminalUtils:
         Run a command and return its execution details.
         Uses temporary files instead of PIPE for output capture (to avoid some PIPE limitations).
 
+        A string command is executed through the shell. A list command is executed
+        directly as an argument list (no shell is spawned and no quoting is needed).
+
         Args:
             command (Union[str, list]): The command to execute
             cwd (Optional[str]): Working directory for command execution
@@ -99,15 +102,18 @@ class TerminalUtils:
         """
         with TimeUtils.timer() as get_elapsed:
             try:
-                if isinstance(command, list):
+                # Lists are executed directly, strings through the shell
+                use_shell = not isinstance(command, list)
+                args = command
+                if not use_shell:
                     command = ' '.join(command)
 
                 if interactive:
                     # For interactive commands, don't capture output
                     process = subprocess.run(
-                        command,
+                        args,
                         cwd=cwd,
-                        shell=True,
+                        shell=use_shell,
                         env=env,
                         timeout=timeout
                     )
@@ -128,20 +134,31 @@ class TerminalUtils:
                         stdout_path = stdout_file.name
                         stderr_path = stderr_file.name
                         
-                        # Modify the command to append all output to our temp files
-                        # Use parentheses to group compound commands
-                        if any(op in command for op in ['&&', '||', '|', ';']):
-                            command = f"( {command} ) >> {stdout_path} 2>> {stderr_path}"
+                        if use_shell:
+                            # Modify the command to append all output to our temp files
+                            # Use parentheses to group compound commands
+                            if any(op in command for op in ['&&', '||', '|', ';']):
+                                command = f"( {command} ) >> {stdout_path} 2>> {stderr_path}"
+                            else:
+                                command = f"{command} >> {stdout_path} 2>> {stderr_path}"
+
+                            process = subprocess.run(
+                                command,
+                                cwd=cwd,
+                                shell=True,
+                                env=env,
+                                timeout=timeout
+                            )
                         else:
-                            command = f"{command} >> {stdout_path} 2>> {stderr_path}"
-                        
-                        process = subprocess.run(
-                            command,
-                            cwd=cwd,
-                            shell=True,
-                            env=env,
-                            timeout=timeout
-                        )
+                            # Redirect the output straight to our temp files
+                            process = subprocess.run(
+                                args,
+                                cwd=cwd,
+                                stdout=stdout_file,
+                                stderr=stderr_file,
+                                env=env,
+                                timeout=timeout
+                            )
                         
                         # Seek to beginning of files to read output
                         stdout_file.seek(0)
@@ -45,16 +45,20 @@ class UsbUtils:
                 logger.info("[USB] Libusb found, skipping installation")
         # On Linux and Mac, check if libusb is installed, if not, install it using the package manager
         if OSUtils.is_linux() or OSUtils.is_mac():
-            if not OSUtils.has_installed("libusb"):
+            # The package name depends on the package manager
+            if OSUtils.has_apt():
+                package = "libusb-1.0-0"
+                cmd = "sudo apt update && sudo apt-get install -y libusb-1.0-0"
+            elif OSUtils.has_dnf():
+                package = "libusb1"
+                cmd = "sudo dnf install -y libusb1"
+            elif OSUtils.has_brew():
+                package = "libusb"
+                cmd = "brew install libusb"
+            else:
+                raise RuntimeError("Unsupported package manager, please install libusb manually")
+            if not OSUtils.has_installed(package):
                 logger.info("[USB] Libusb not found, installing...")
-                if OSUtils.has_apt():
-                    cmd = "sudo apt update && sudo apt-get install -y libusb-1.0-0"
-                elif OSUtils.has_dnf():
-                    cmd = "sudo dnf install -y libusb1"
-                elif OSUtils.has_brew():
-                    cmd = "brew install libusb"
-                else:
-                    raise RuntimeError("Unsupported package manager, please install libusb manually")
                 result = TerminalUtils.run_command(cmd, interactive=True) # Interactive because it needs sudo password on Linux
                 if result.exit_code != 0:
                     raise RuntimeError("Failed to install libusb, please install it manually")
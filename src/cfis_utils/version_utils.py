@@ -1,10 +1,143 @@
 # Standard libraries
 import datetime
+import mmap
+import os
+import re
+from pathlib import Path
+from typing import Union, Optional, Tuple, Dict
+
+# Size of the first block of a file searched by get_version before mapping the whole file
+_HEAD_SIZE = 4096
+# Compiled patterns finding a field definition, by field name
+_field_patterns: Dict[bytes, "re.Pattern[bytes]"] = {}
+# Versions read by get_version: {(absolute path, field name): ((inode, mtime in ns, size), version)}
+_version_cache: Dict[Tuple[str, str], Tuple[Tuple[int, int, int], str]] = {}
 
 class VersionUtils():
 
     @staticmethod
-    def increment_version(current_version_str: str) -> str:
+    def _find_field_value(data: Union[bytes, mmap.mmap], key: bytes) -> Optional[Tuple[int, int]]:
+        """
+        Finds the first line defining 'key = value' in the data (leading whitespace and
+        whitespace around '=' are allowed) and returns the (start, end) byte offsets of
+        the value, excluding the surrounding quotes. Returns None if not found.
+        """
+        pattern = _field_patterns.get(key)
+        if pattern is None:
+            # '[^\S\n]' is any whitespace except a newline
+            pattern = re.compile(
+                rb'^[^\S\n]*' + re.escape(key) + rb'[^\S\n]*=[^\S\n]*'
+                # Quoted value: up to the closing quote (anything after it, e.g. a comment, is kept)
+                # Unquoted value: up to a comment or the end of the line
+                rb'(?:"([^"\n]*)"|\'([^\'\n]*)\'|([^#\n]*))',
+                re.MULTILINE
+            )
+            _field_patterns[key] = pattern
+        match = pattern.search(data)
+        if match is None:
+            return None
+        if match.group(3) is None:
+            group = 1 if match.group(1) is not None else 2
+            return match.span(group)
+        value_start = match.start(3)
+        return value_start, value_start + len(match.group(3).rstrip())
+
+    @staticmethod
+    def get_version(toml_file_path: Union[str, Path], field_name: str = "version") -> str:
+        """
+        Reads the version string from a TOML file (e.g. pyproject.toml).
+
+        Finds the first line defining 'field_name = "..."' (leading whitespace and
+        whitespace around '=' are allowed) and returns its value without quotes.
+        The first 4 KiB of the file are searched first, and the whole file is
+        memory-mapped only if the field is not found there. The search works on
+        bytes, so lines that do not match are never decoded. The result is cached
+        until the modification time or size of the file changes.
+
+        Args:
+            toml_file_path: The path to the TOML file.
+            field_name: The name of the field holding the version (default: 'version').
+
+        Returns:
+            The version string, e.g. 'v2025.04.12.05'.
+
+        Raises:
+            FileNotFoundError: If the file does not exist.
+            ValueError: If no line defining the field is found.
+        """
+        toml_file_path = Path(toml_file_path)
+        with open(toml_file_path, "rb") as f:
+            stat = os.fstat(f.fileno())
+            # The inode changes when the file is replaced (e.g. written atomically)
+            file_state = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+            key = (os.path.abspath(toml_file_path), field_name)
+            cached = _version_cache.get(key)
+            if cached is not None and cached[0] == file_state:
+                return cached[1]
+            # The version is usually defined near the top of the file: search the complete
+            # lines of the first block with a single read before mapping the whole file
+            head = f.read(_HEAD_SIZE)
+            if len(head) < stat.st_size:
+                head = head[:head.rfind(b"\n") + 1]
+            span = VersionUtils._find_field_value(head, field_name.encode("utf-8"))
+            if span is not None:
+                version = head[span[0]:span[1]].decode("utf-8")
+                _version_cache[key] = (file_state, version)
+                return version
+            if len(head) < stat.st_size:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    span = VersionUtils._find_field_value(mm, field_name.encode("utf-8"))
+                    if span is not None:
+                        version = mm[span[0]:span[1]].decode("utf-8")
+                        _version_cache[key] = (file_state, version)
+                        return version
+        raise ValueError(f"Could not find a line defining '{field_name}' with separator '=' in {toml_file_path}")
+
+    @staticmethod
+    def save_version(toml_file_path: Union[str, Path], new_version: str, field_name: str = "version") -> None:
+        """
+        Replaces the version string in a TOML file (e.g. pyproject.toml), keeping the
+        rest of the line (quotes, spacing) and of the file untouched.
+
+        If the new version has the same length as the current one (the usual case for
+        'vyyyy.mm.dd.xx' versions) the bytes are replaced in place through a memory map.
+        Otherwise only the part of the file from the version onwards is rewritten.
+
+        Args:
+            toml_file_path: The path to the TOML file.
+            new_version: The new version string (without quotes).
+            field_name: The name of the field holding the version (default: 'version').
+
+        Raises:
+            FileNotFoundError: If the file does not exist.
+            ValueError: If no line defining the field is found.
+        """
+        toml_file_path = Path(toml_file_path)
+        new_value = new_version.encode("utf-8")
+        # Forget the cached version, the modification time may not change if the file is
+        # rewritten quickly (coarse timestamps)
+        _version_cache.pop((os.path.abspath(toml_file_path), field_name), None)
+        with open(toml_file_path, "r+b") as f:
+            span = None
+            # Empty files can't be memory-mapped
+            if f.seek(0, 2) > 0:
+                with mmap.mmap(f.fileno(), 0) as mm:
+                    span = VersionUtils._find_field_value(mm, field_name.encode("utf-8"))
+                    if span is not None and span[1] - span[0] == len(new_value):
+                        mm[span[0]:span[1]] = new_value
+                        mm.flush()
+                        return
+            if span is None:
+                raise ValueError(f"Could not find a line defining '{field_name}' with separator '=' in {toml_file_path}")
+            # Different length: rewrite from the version onwards
+            f.seek(span[1])
+            tail = f.read()
+            f.seek(span[0])
+            f.write(new_value + tail)
+            f.truncate()
+
+    @staticmethod
+    def increment_version(current_version_str: str, today: Optional[datetime.date] = None) -> str:
         """
         Increments a version string based on the current date.
 
@@ -19,6 +152,9 @@ class VersionUtils():
 
         Args:
             current_version_str: The current version string in 'vyyyy.mm.dd.xx' format.
+            today: The date to consider as today. Defaults to the current date; callers
+                   incrementing many versions can pass it once instead of having it
+                   looked up on every call.
 
         Returns:
             The calculated next version string in 'vyyyy.mm.dd.xx' format.
@@ -32,34 +168,45 @@ class VersionUtils():
         if not current_version_str.startswith('v'):
             raise ValueError("Version string must start with 'v'")
         
-        parts = current_version_str[1:].split('.')
-        if len(parts) != 4:
-            raise ValueError("Version string format must be 'vyyyy.mm.dd.xx'")
+        version_date = None
+        if len(current_version_str) == 14 and current_version_str[5] == current_version_str[8] == current_version_str[11] == '.':
+            # Fast path for the canonical zero-padded format: parse and validate
+            # the date (e.g., rejects day 32) in a single call
+            try:
+                version_date = datetime.date.fromisoformat(current_version_str[1:11].replace('.', '-'))
+                revision = int(current_version_str[12:])
+            except ValueError:
+                # Let the general parser decide on anything unusual
+                version_date = None
+        if version_date is None:
+            parts = current_version_str[1:].split('.')
+            if len(parts) != 4:
+                raise ValueError("Version string format must be 'vyyyy.mm.dd.xx'")
 
-        # Attempt to convert parts to integers
-        year, month, day, revision = map(int, parts)
-        
-        # Create a date object to validate the date itself (e.g., rejects day 32)
-        version_date = datetime.date(year, month, day)
+            # Attempt to convert parts to integers
+            year, month, day, revision = map(int, parts)
+
+            # Create a date object to validate the date itself (e.g., rejects day 32)
+            version_date = datetime.date(year, month, day)
         
         # --- Logic ---
-        today = datetime.date.today()
+        if today is None:
+            today = datetime.date.today()
 
         if version_date == today:
             # Same day: Increment revision
             next_rev = revision + 1
-            next_year, next_month, next_day = year, month, day
         elif version_date < today:
                 # Previous day: Update date to today, reset revision to 1
             next_rev = 1
-            next_year, next_month, next_day = today.year, today.month, today.day
         else: # version_date > today
             # Future date: Invalid scenario
                 raise ValueError(f"Version date {version_date} cannot be in the future compared to today {today}")
 
         # --- Formatting Output ---
+        # The next version is always dated today
         # Ensure month, day, and revision have leading zeros (01, 02, ..., 10, 11...)
-        return f"v{next_year}.{next_month:02d}.{next_day:02d}.{next_rev:02d}"
+        return "v%d.%02d.%02d.%02d" % (today.year, today.month, today.day, next_rev)
 
 if __name__ == "__main__":
     # Example usage